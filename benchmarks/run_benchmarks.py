@@ -0,0 +1,195 @@
+"""
+Benchmarks for board construction, position loading and game playback.
+
+Every benchmark is timed over a few repeats, then run once more under tracemalloc to record
+its peak memory. Results are written as JSON and can be compared against a stored baseline;
+the script exits with status 1 when a benchmark got slower than the tolerance allows.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+module_dir = os.path.dirname(os.path.abspath(__file__))
+repo_dir = os.path.dirname(module_dir)
+sys.path.insert(0, os.path.join(repo_dir, "src"))
+
+import chess
+import manim
+from manim_chessrender.mobjects.chessboard import ChessBoard
+from manim_chessrender.pgn import iter_games
+
+EXAMPLE_PGN = os.path.join(repo_dir, "example", "example.pgn")
+MIDDLEGAME_FEN = "r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N1PN2/PP3PPP/R2QKB1R w KQ - 0 9"
+
+
+def count_mobjects(chessboard):
+    return len(chessboard.get_family())
+
+
+def bench_construction(options):
+    return None, lambda _: ChessBoard()
+
+
+def bench_initialize_board(options):
+    return ChessBoard, lambda chessboard: chessboard.initialize_board()
+
+
+def bench_load_fen(options):
+    return ChessBoard, lambda chessboard: chessboard.load_fen(MIDDLEGAME_FEN)
+
+
+def bench_execute_move(options):
+    games = [[move.uci() for move in moves] for _, moves in iter_games(EXAMPLE_PGN, limit=options.games)]
+
+    def play_games(_):
+        for moves in games:
+            chessboard = ChessBoard()
+            chessboard.initialize_board()
+            for move in moves:
+                chessboard.execute_move(move)
+        return chessboard
+
+    return None, play_games
+
+
+def bench_load_pgn(options):
+    with open(EXAMPLE_PGN) as pgn_file:
+        text = pgn_file.read().strip() + "\n\n"
+    pgn_path = os.path.join(options.work_dir, "synthetic.pgn")
+    with open(pgn_path, "w") as pgn_file:
+        for _ in range(options.pgn_copies):
+            pgn_file.write(text)
+    return ChessBoard, lambda chessboard: chessboard.load_pgn_and_get_games(pgn_path)
+
+
+# Name and factory of every benchmark. A factory returns a setup callable (or None) creating
+# the state passed to the timed callable, which is not part of the measurement.
+BENCHMARKS = [
+    ("construction", bench_construction),
+    ("initialize_board", bench_initialize_board),
+    ("load_fen", bench_load_fen),
+    ("execute_move", bench_execute_move),
+    ("load_pgn", bench_load_pgn),
+]
+
+
+def measure(setup, func, repeat):
+    """
+    Times a callable and records its peak memory.
+
+    Args:
+        setup (callable): Creates the state passed to `func`, or None.
+        func (callable): The code to measure, called with the state.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        dict: The best and mean run time in seconds, the peak memory in KiB and, when
+              `func` returns a ChessBoard, its number of mobjects.
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        func(state)
+        times.append(time.perf_counter() - start)
+
+    state = setup() if setup else None
+    tracemalloc.start()
+    try:
+        result = func(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    chessboard = result if isinstance(result, ChessBoard) else state
+    return {
+        "best_seconds": round(min(times), 6),
+        "mean_seconds": round(sum(times) / len(times), 6),
+        "peak_kib": round(peak / 1024, 1),
+        "mobjects": count_mobjects(chessboard) if isinstance(chessboard, ChessBoard) else None,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compares results against a baseline.
+
+    Args:
+        results (dict): The benchmark results by name.
+        baseline (dict): The baseline results by name.
+        tolerance (float): The allowed slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        list: The names of the benchmarks slower than the baseline allows.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"  {name:18} no baseline")
+            continue
+        ratio = result["best_seconds"] / reference["best_seconds"] if reference["best_seconds"] else 1.0
+        regressed = ratio > 1 + tolerance
+        print(f"  {name:18} {ratio:6.2f}x baseline{'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark manim-chessrender.")
+    parser.add_argument("-o", "--output", default=None, help="Where to write the results as JSON.")
+    parser.add_argument("--baseline", default=None, help="A results file to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline. Defaults to 0.25 (25%%).")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Timed runs per benchmark. Defaults to 3.")
+    parser.add_argument("--games", type=int, default=None,
+                        help="Number of example games played by execute_move. Defaults to all.")
+    parser.add_argument("--pgn-copies", type=int, default=20,
+                        help="Copies of the example PGN in the synthetic PGN. Defaults to 20.")
+    parser.add_argument("-k", "--select", default=None, help="Only run benchmarks whose name contains this.")
+    options = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="chessrender-bench-") as work_dir:
+        options.work_dir = work_dir
+        for name, factory in BENCHMARKS:
+            if options.select and options.select not in name:
+                continue
+            setup, func = factory(options)
+            results[name] = measure(setup, func, options.repeat)
+            result = results[name]
+            print(f"{name:18} {result['best_seconds']:9.4f}s best  {result['mean_seconds']:9.4f}s mean  "
+                  f"{result['peak_kib']:10.1f} KiB peak  mobjects: {result['mobjects']}")
+
+    report = {
+        "python": platform.python_version(),
+        "manim": manim.__version__,
+        "chess": chess.__version__,
+        "repeat": options.repeat,
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        print(f"Compared with {options.baseline}:")
+        if compare(results, baseline, options.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,41 @@
 __version__ = "0.0.1"
 
-from .mobjects.chessboard import *
+import importlib
 
-__all__ = ["ChessBoard", "Pawn", "King", "Queen", "Knight", "Bishop"]
+# Public names by the module defining them. They are imported on first use, so that
+# importing the package, e.g. for PGN parsing or the command line, does not import manim.
+_lazy_imports = {
+    "ChessBoard": ".mobjects.chessboard",
+    "ChessPiece": ".mobjects.chess_piece",
+    "Pawn": ".mobjects.chess_piece",
+    "King": ".mobjects.chess_piece",
+    "Queen": ".mobjects.chess_piece",
+    "Rook": ".mobjects.chess_piece",
+    "Knight": ".mobjects.chess_piece",
+    "Bishop": ".mobjects.chess_piece",
+    "ChessBoardGrid": ".mobjects.board_grid",
+    "PieceSlide": ".animations",
+    "PieceFadeOut": ".animations",
+    "iter_games": ".pgn",
+    "PGNIndex": ".pgn",
+    "Profiler": ".profiling",
+    "FrameCache": ".frame_cache",
+    "GameFeed": ".feed",
+    "board_from_fen": ".chess_utils",
+    "index_to_position": ".chess_utils",
+    "position_to_index": ".chess_utils",
+}
+
+__all__ = list(_lazy_imports)
+
+
+def __getattr__(name):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
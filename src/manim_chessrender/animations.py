@@ -0,0 +1,82 @@
+from manim import Animation, FadeOut, Group
+import numpy as np
+
+
+class PieceSlide(Animation):
+    """
+    Slides one or more pieces in a straight line to their target points.
+
+    Unlike `piece.animate.move_to(...)`, no copy of the piece is made: the start points are
+    recorded when the animation begins and only the piece positions are interpolated, so the
+    image data of the pieces is never duplicated. Several pieces can be slid by one animation.
+
+    When several pieces are slid, the scene adds the mobject of the animation while it plays,
+    which breaks up any group in the scene holding the pieces. Pass that group, such as
+    `chessboard.board`, to animate it in place of a new group of the pieces.
+
+    Example:
+        self.play(PieceSlide((king, chessboard.square_center('g1')),
+                             (rook, chessboard.square_center('f1')), group=chessboard.board))
+
+    Attributes:
+        pieces (list): The mobjects being slid.
+        end_points (numpy.ndarray): The target center of every piece, one row per piece.
+    """
+
+    def __init__(self, *slides, group=None, **kwargs):
+        """
+        Initializes the animation.
+
+        Args:
+            *slides (tuple): Pairs of (piece, point), the point being where the center of the piece ends up.
+            group (Mobject, optional): A mobject holding the pieces, used as the mobject of the animation.
+                                       Defaults to the piece, or a new group of the pieces.
+            **kwargs: Additional keyword arguments passed to the Animation superclass.
+
+        Raises:
+            ValueError: If no slide is given.
+        """
+        if not slides:
+            raise ValueError("PieceSlide needs at least one (piece, point) pair")
+        self.pieces = [piece for piece, _ in slides]
+        self.end_points = np.array([point for _, point in slides], dtype=float)
+        self.start_points = None
+        if group is None:
+            group = self.pieces[0] if len(self.pieces) == 1 else Group(*self.pieces)
+        super().__init__(group, **kwargs)
+
+    def begin(self):
+        self.start_points = np.array([piece.get_center() for piece in self.pieces])
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+        self.interpolate(0)
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+    def interpolate_mobject(self, alpha):
+        points = self.start_points + self.rate_func(alpha) * (self.end_points - self.start_points)
+        for piece, point in zip(self.pieces, points):
+            piece.move_to(point)
+
+
+class PieceFadeOut(FadeOut):
+    """
+    Fades out a piece that has already been taken out of its board group.
+
+    The piece is no longer drawn with the board, so the animation adds it to the scene on its
+    own while it fades out. Like `FadeOut`, it removes the piece from the scene afterwards.
+
+    Example:
+        self.play(PieceFadeOut(captured_piece))
+    """
+
+    def __init__(self, piece, **kwargs):
+        """
+        Initializes the animation.
+
+        Args:
+            piece (Mobject): The piece to fade out.
+            **kwargs: Additional keyword arguments passed to the FadeOut superclass.
+        """
+        super().__init__(piece, introducer=True, **kwargs)
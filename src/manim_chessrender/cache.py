@@ -0,0 +1,26 @@
+import os
+
+# Environment variable overriding the location of the on-disk cache.
+CACHE_ENV = "MANIM_CHESSRENDER_CACHE"
+
+
+def cache_dir(*parts):
+    """
+    Returns a directory of the on-disk cache, creating it if needed.
+
+    The cache lives in $MANIM_CHESSRENDER_CACHE if set, otherwise in manim_chessrender
+    under $XDG_CACHE_HOME or ~/.cache.
+
+    Args:
+        *parts (str): The path of the directory within the cache.
+
+    Returns:
+        str: The path of the directory.
+    """
+    root = os.environ.get(CACHE_ENV)
+    if not root:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(base, "manim_chessrender")
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
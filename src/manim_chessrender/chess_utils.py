@@ -0,0 +1,59 @@
+import chess
+
+
+def index_to_position(index):
+    """
+    Convert an index (0-63) to a chess board position ('a1' to 'h8').
+
+    Args:
+        index (int): The index to convert, should be in the range 0-63.
+
+    Returns:
+        str: The corresponding chess board position.
+
+    Raises:
+        ValueError: If the index is out of range.
+    """
+    if not 0 <= index < 64:
+        raise ValueError("Index must be between 0 and 63")
+    row = index // 8
+    col = index % 8
+    return chr(col + ord('a')) + str(row + 1)
+
+
+def position_to_index(position):
+    """
+    Convert a chess board position ('a1' to 'h8') to an index (0-63).
+
+    Args:
+        position (str): The position to convert, should be in the format 'a1' to 'h8'.
+
+    Returns:
+        int: The corresponding index.
+
+    Raises:
+        ValueError: If the position is malformed.
+    """
+    if len(position) != 2 or position[0] not in 'abcdefgh' or position[1] not in '12345678':
+        raise ValueError("Position must be in the format 'a1' to 'h8'")
+    col = ord(position[0]) - ord('a')
+    row = int(position[1]) - 1
+    return row * 8 + col
+
+
+def board_from_fen(fen):
+    """
+    Creates a python-chess board from a full FEN string or from just its piece placement field.
+
+    Args:
+        fen (str): The FEN string.
+
+    Returns:
+        chess.Board: The board described by the FEN.
+    """
+    fields = fen.split()
+    if len(fields) == 1:
+        board = chess.Board(None)
+        board.set_board_fen(fields[0])
+        return board
+    return chess.Board(fen)
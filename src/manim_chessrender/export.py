@@ -0,0 +1,201 @@
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import traceback
+
+import chess
+
+from .pgn import iter_games
+from .still import StillRenderer
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+# Bump when the look of the diagrams changes, so that every diagram is redrawn.
+DIAGRAM_VERSION = 1
+
+# An EPD "id" operation, e.g. id "puzzle 12";
+EPD_ID_REGEX = re.compile(r'\bid\s+"([^"]*)"')
+
+
+def safe_name(name):
+    """
+    Turns a position name into a file name.
+
+    Args:
+        name (str): The position name.
+
+    Returns:
+        str: The name with every character but letters, digits, '-', '_' and '.' replaced by '_'.
+    """
+    return re.sub(r"[^A-Za-z0-9._-]", "_", name).strip("._") or "position"
+
+
+def read_epd(path):
+    """
+    Reads a list of positions, one FEN or EPD record per line.
+
+    Empty lines and lines starting with '#' are skipped. Positions are named after their
+    EPD id operation if they have one, otherwise after their line number.
+
+    Args:
+        path (str): The path to the FEN or EPD file.
+
+    Yields:
+        tuple: The name and FEN of every position.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    seen = set()
+    with open(path) as epd_file:
+        for number, line in enumerate(epd_file, 1):
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            match = EPD_ID_REGEX.search(line)
+            name = safe_name(match.group(1)) if match else f"{stem}-{number:06d}"
+            if name in seen:
+                name = f"{name}-{number:06d}"
+            seen.add(name)
+            # A FEN ends with the move counters, an EPD record with its operations
+            counters = len(fields) >= 6 and fields[4].isdigit() and fields[5].isdigit()
+            yield name, " ".join(fields[:6] if counters else fields[:4])
+
+
+def read_pgn_positions(path):
+    """
+    Reads every position of the mainline of every game in a PGN file.
+
+    Args:
+        path (str): The path to the PGN file.
+
+    Yields:
+        tuple: The name, e.g. "games-00003-012" for ply 12 of game 3, and FEN of every position.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for game_id, (headers, moves) in enumerate(iter_games(path)):
+        board = chess.Board(headers["FEN"]) if "FEN" in headers else chess.Board()
+        yield f"{stem}-{game_id:05d}-000", board.fen()
+        for ply, move in enumerate(moves, 1):
+            board.push(move)
+            yield f"{stem}-{game_id:05d}-{ply:03d}", board.fen()
+
+
+def read_positions(path):
+    """
+    Reads positions from a PGN file, or from a FEN or EPD list for any other extension.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        iterator: Pairs of (name, FEN).
+    """
+    if path.lower().endswith(".pgn"):
+        return read_pgn_positions(path)
+    return read_epd(path)
+
+
+def diagram_hash(fen, options):
+    """
+    Returns the content hash of a diagram: only the piece placement and the drawing options matter.
+
+    Args:
+        fen (str): The FEN of the position.
+        options (dict): The StillRenderer options.
+
+    Returns:
+        str: The hex digest.
+    """
+    content = json.dumps([DIAGRAM_VERSION, fen.split()[0], sorted(options.items())])
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME)) as manifest_file:
+            return json.load(manifest_file).get("diagrams", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, diagrams):
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as manifest_file:
+        json.dump({"version": DIAGRAM_VERSION, "diagrams": diagrams}, manifest_file, indent=1)
+    os.replace(temp_path, manifest_path)
+
+
+_renderer = None
+
+
+def _init_worker(options):
+    global _renderer
+    _renderer = StillRenderer(**options)
+
+
+def _draw_diagram(task):
+    name, fen, path = task
+    try:
+        _renderer.save(fen, path)
+    except Exception:
+        return name, traceback.format_exc()
+    return name, None
+
+
+def export_diagrams(positions, output_dir, options=None, image_format="png", workers=None, force=False):
+    """
+    Draws diagrams of many positions in a pool of worker processes, skipping unchanged ones.
+
+    A manifest in the output directory records the content hash of every diagram; a diagram
+    whose hash is unchanged and whose file exists is not drawn again. Diagrams exported by
+    earlier runs stay in the manifest as long as their file exists.
+
+    Args:
+        positions (iterable): Pairs of (name, FEN), e.g. from `read_positions`.
+        output_dir (str): The directory of the diagrams and of the manifest.
+        options (dict, optional): Keyword arguments for StillRenderer. Defaults to its defaults.
+        image_format (str, optional): The file extension of the diagrams. Defaults to "png".
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        force (bool, optional): If True, redraw every diagram. Defaults to False.
+
+    Returns:
+        dict: The number of diagrams "written", "skipped" and "failed", and the "errors" by name.
+    """
+    options = dict(options or {})
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_manifest(output_dir)
+    diagrams, tasks, skipped = {}, [], 0
+    for name, fen in positions:
+        file_name = f"{name}.{image_format}"
+        entry = {"file": file_name, "fen": fen, "hash": diagram_hash(fen, options)}
+        diagrams[name] = entry
+        path = os.path.join(output_dir, file_name)
+        if not force and previous.get(name, {}).get("hash") == entry["hash"] and os.path.exists(path):
+            skipped += 1
+            continue
+        tasks.append((name, fen, path))
+
+    errors = {}
+    if tasks:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(options,)) as pool:
+            chunksize = max(1, min(256, len(tasks) // (4 * workers)))
+            for name, error in pool.imap_unordered(_draw_diagram, tasks, chunksize=chunksize):
+                if error is not None:
+                    logger.error("Could not draw %s:\n%s", name, error)
+                    errors[name] = error
+                    del diagrams[name]
+
+    # Keep the diagrams of earlier runs whose file still exists
+    for name, entry in previous.items():
+        file_name = entry.get("file")
+        if name in diagrams or name in errors or not file_name:
+            continue
+        if os.path.exists(os.path.join(output_dir, file_name)):
+            diagrams[name] = entry
+    save_manifest(output_dir, diagrams)
+    return {"written": len(tasks) - len(errors), "skipped": skipped, "failed": len(errors), "errors": errors}
@@ -0,0 +1,124 @@
+from collections import namedtuple
+import queue
+import threading
+
+from .pgn import iter_games
+from .plan import compile_moves
+
+# A game read and compiled by GameFeed: its headers, mainline moves and plan.
+CompiledGame = namedtuple("CompiledGame", ["headers", "moves", "plan"])
+
+# Marks the end of the games in the queue.
+_END = object()
+
+
+class _Failure:
+    def __init__(self, error):
+        self.error = error
+
+
+class GameFeed:
+    """
+    Reads and compiles the games of a PGN file in a background thread while they are consumed.
+
+    Parsed games wait in a bounded queue, so the reader stays at most `maxsize` games ahead
+    of the consumer. An error raised while reading or compiling, including a parse error
+    such as an illegal move, is raised again by the consumer once it has taken every game
+    read before it.
+
+    Example:
+        with GameFeed("games.pgn") as feed:
+            for headers, moves, plan in feed:
+                ...
+
+    Attributes:
+        source (str | file): The PGN file.
+        queue (queue.Queue): The games read but not consumed yet.
+    """
+
+    def __init__(self, source, where=None, skip=0, limit=None, maxsize=4, validate=False):
+        """
+        Starts reading games in a background thread.
+
+        Args:
+            source (str | file): The path to the PGN file, or a PGN file opened in text mode.
+            where (callable | dict, optional): A header filter, see `pgn.header_matcher`.
+            skip (int, optional): The number of matching games to skip. Defaults to 0.
+            limit (int, optional): The maximum number of games to read. Defaults to all games.
+            maxsize (int, optional): The maximum number of games waiting in the queue. Defaults to 4.
+            validate (bool, optional): If True, check the legality of every move again while compiling.
+                                       Defaults to False, as the PGN parser only yields legal moves.
+        """
+        self.source = source
+        self.queue = queue.Queue(maxsize=max(1, maxsize))
+        self._stopped = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._produce, args=(where, skip, limit, validate),
+                                        name="GameFeed", daemon=True)
+        self._thread.start()
+
+    def _produce(self, where, skip, limit, validate):
+        games = iter_games(self.source, where, skip, limit, strict=True)
+        try:
+            for headers, moves in games:
+                if self._stopped.is_set():
+                    return
+                self._put(CompiledGame(headers, moves, compile_moves(moves, headers.get("FEN"), validate)))
+        except BaseException as error:
+            self._put(_Failure(error))
+        finally:
+            games.close()
+            self._put(_END)
+
+    def _put(self, item):
+        # Wait for room in the queue, but give up once the consumer has closed the feed
+        while not self._stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """
+        Takes the next game, waiting for it to be read if needed.
+
+        Returns:
+            CompiledGame: The headers, moves and plan of the game.
+
+        Raises:
+            StopIteration: Once every game has been taken.
+            Exception: The error that stopped the reader, if any.
+        """
+        if self._finished:
+            raise StopIteration
+        item = self.queue.get()
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self._finished = True
+            raise item.error
+        return item
+
+    def close(self):
+        """
+        Stops the reader and drops the games not consumed yet.
+        """
+        self._finished = True
+        self._stopped.set()
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,133 @@
+import hashlib
+import logging
+import os
+
+import chess.polyglot
+import numpy as np
+
+from .cache import cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+class FrameCache:
+    """
+    An on-disk cache of rendered frames keyed by board position, with a size limit.
+
+    Frames are stored as .npy files. The least recently used frames are evicted once the
+    cache grows beyond `max_bytes`; reading a frame marks it as used.
+
+    Attributes:
+        directory (str): The directory of the frames.
+        max_bytes (int): The maximum total size of the frames.
+        size (int): The current total size of the frames.
+    """
+
+    SUFFIX = ".npy"
+
+    def __init__(self, directory=None, max_bytes=512 * 2 ** 20):
+        """
+        Opens a frame cache.
+
+        Args:
+            directory (str, optional): The directory of the frames. Defaults to cache_dir("frames").
+            max_bytes (int, optional): The maximum total size of the frames. Defaults to 512 MiB.
+        """
+        self.directory = directory or cache_dir("frames")
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.size = sum(entry.stat().st_size for entry in self._entries())
+
+    @staticmethod
+    def key(board, *parts):
+        """
+        Returns the cache key of a position drawn with the given theme and resolution.
+
+        Args:
+            board (chess.Board): The position; its Zobrist hash identifies it.
+            *parts: Anything else the frame depends on, such as the board theme and resolution.
+                    Their repr must be stable across runs.
+
+        Returns:
+            str: The key.
+        """
+        digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+        return f"{chess.polyglot.zobrist_hash(board):016x}-{digest}"
+
+    def path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _entries(self):
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(self.SUFFIX)]
+
+    def get(self, key):
+        """
+        Reads a frame and marks it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            numpy.ndarray: The frame, or None if it is not cached.
+        """
+        path = self.path(key)
+        try:
+            frame = np.load(path, allow_pickle=False)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return frame
+
+    def put(self, key, frame):
+        """
+        Stores a frame, then evicts the least recently used frames if the cache is too large.
+
+        Args:
+            key (str): The cache key.
+            frame (numpy.ndarray): The frame.
+        """
+        path = self.path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as frame_file:
+                np.save(frame_file, frame, allow_pickle=False)
+            # A frame stored again under the same key replaces the old one
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(temp_path, path)
+        except OSError as error:
+            logger.warning("Could not cache frame %s: %s", path, error)
+            return
+        self.size += os.path.getsize(path) - replaced
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used frames until the cache fits in `max_bytes`.
+        """
+        entries = sorted(((entry.stat(), entry.path) for entry in self._entries()),
+                         key=lambda item: item[0].st_mtime_ns)
+        self.size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if self.size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= stat.st_size
+
+    def clear(self):
+        """
+        Removes every frame.
+        """
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        self.size = 0
@@ -0,0 +1,120 @@
+from manim import Group, AnimationGroup, config
+from collections.abc import Mapping
+import math
+import numpy as np
+import os
+from ..pgn import PGNIndex
+from .chessboard import ChessBoard
+
+
+class ChessBoardGrid(Group):
+    """
+    A grid of chessboards playing several games side by side.
+
+    Every board is stamped from the same board template and every piece shows one of the
+    shared piece images, so adding a board mostly costs its pieces. Labels default to the
+    glyph atlas, whose outlines are shared by all boards.
+
+    Example:
+        grid = ChessBoardGrid(8)
+        grid.load_pgns(["round1.pgn", "round2.pgn"])
+        self.add(grid)
+        for animation in grid.steps():
+            self.play(animation)
+
+    Attributes:
+        boards (list): The ChessBoard objects, in row-major order.
+        columns (int): The number of boards per row.
+        rows (int): The number of rows.
+        plans (list): The compiled plan of the game loaded on each board.
+    """
+
+    def __init__(self, num_boards, columns=None, buff=1.0, width=None, height=None, **kwargs):
+        """
+        Lays out a grid of empty chessboards that fits in the frame.
+
+        Args:
+            num_boards (int): The number of boards.
+            columns (int, optional): The number of boards per row. Defaults to a roughly square grid.
+            buff (float, optional): The space between boards, in squares. Defaults to 1.0.
+            width (float, optional): The width available to the grid. Defaults to the frame width.
+            height (float, optional): The height available to the grid. Defaults to the frame height.
+            **kwargs: Additional keyword arguments passed to every ChessBoard.
+        """
+        super().__init__()
+        kwargs.setdefault("label_mode", "atlas")
+        self.columns = columns or math.ceil(math.sqrt(num_boards))
+        self.rows = math.ceil(num_boards / self.columns)
+        width = width or config.frame_width
+        height = height or config.frame_height
+
+        pitch = min(width / self.columns, height / self.rows)
+        square_size = pitch / (8 + buff)
+        self.boards = []
+        for index in range(num_boards):
+            row, column = divmod(index, self.columns)
+            center = np.array([(column - (self.columns - 1) / 2) * pitch, ((self.rows - 1) / 2 - row) * pitch, 0])
+            board = ChessBoard(**kwargs)
+            board.move_board(center, square_size)
+            self.boards.append(board)
+            self.add(board.board)
+        self.plans = [[] for _ in self.boards]
+
+    def load_games(self, games):
+        """
+        Loads one game per board, in order, and compiles its moves.
+
+        Args:
+            games (iterable): Move lists, or (headers, moves) pairs as yielded by `iter_games`.
+                              The FEN header, if any, gives the starting position.
+
+        Raises:
+            ValueError: If there are more games than boards.
+        """
+        games = list(games)
+        if len(games) > len(self.boards):
+            raise ValueError(f"{len(games)} games do not fit on {len(self.boards)} boards")
+        self.plans = [[] for _ in self.boards]
+        for index, game in enumerate(games):
+            headers = {}
+            if isinstance(game, tuple) and len(game) == 2 and isinstance(game[0], Mapping):
+                headers, game = game
+            start_fen = headers.get("FEN")
+            self.boards[index].load_game(game, start_fen)
+            self.plans[index] = self.boards[index].game_plan
+
+    def load_pgns(self, sources):
+        """
+        Loads games from PGN files, one game per board.
+
+        Args:
+            sources (iterable): PGN paths, meaning their first game, or (path, game id) pairs.
+        """
+        games = []
+        for source in sources:
+            pgn_path, game_id = (source, 0) if isinstance(source, (str, os.PathLike)) else source
+            games.append(PGNIndex(pgn_path).read_game(game_id))
+        self.load_games(games)
+
+    def step(self):
+        """
+        Plays the next ply of every game that has not ended yet.
+
+        Returns:
+            AnimationGroup: The moves of all boards at once, or None once every game has ended.
+        """
+        animations = [board.apply_ply(plan[board.ply]) for board, plan in zip(self.boards, self.plans)
+                      if board.ply < len(plan)]
+        return AnimationGroup(*animations, group=self) if animations else None
+
+    def steps(self):
+        """
+        Plays every game to its end, one timestep at a time.
+
+        Yields:
+            AnimationGroup: The animation of a timestep; play it before asking for the next.
+        """
+        animation = self.step()
+        while animation is not None:
+            yield animation
+            animation = self.step()
@@ -1,8 +1,281 @@
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+from ..render import QUALITIES, RenderJob, render_game, render_game_split, render_games_shared, run_jobs
+
+
+def parse_selection(selection):
+    """
+    Parses a game selection such as "0,3,5-9" into a set of game ids.
+
+    Args:
+        selection (str): Comma separated game ids and inclusive ranges.
+
+    Returns:
+        set: The selected game ids.
+
+    Raises:
+        ValueError: If the selection is malformed.
+    """
+    game_ids = set()
+    for part in selection.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            game_ids.update(range(int(first), int(last) + 1))
+        else:
+            game_ids.add(int(part))
+    return game_ids
+
+
+def find_pgn_files(path):
+    """
+    Returns the PGN files at a path: the file itself, or every .pgn file in a directory.
+
+    Args:
+        path (str): A PGN file or a directory.
+
+    Returns:
+        list: The sorted paths of the PGN files.
+    """
+    if os.path.isdir(path):
+        return sorted(os.path.join(path, name) for name in os.listdir(path) if name.lower().endswith(".pgn"))
+    return [path]
+
+
 class ManimChessCLI():
-    
+    """
+    Command line interface for batch rendering chess games and exporting diagrams.
+
+    Example:
+        manim-chessrender render games.pgn --games 0-9 --workers 4 --quality m --output videos
+        manim-chessrender export puzzles.epd --size 320 --output diagrams
+    """
+
     def __init__(self) -> None:
-        print("CHESS CLI")
+        self.parser = argparse.ArgumentParser(
+            prog="manim-chessrender", description="Render chess games with manim.")
+        commands = self.parser.add_subparsers(dest="command", required=True)
+
+        render = commands.add_parser("render", help="Render every selected game to its own video.")
+        render.add_argument("source", help="A PGN file or a directory of PGN files.")
+        render.add_argument("-g", "--games", default=None,
+                            help="Game ids to render within each file, e.g. '0,3,5-9'. Defaults to all games.")
+        render.add_argument("--where", action="append", default=[], metavar="TAG=VALUE",
+                            help="Only render games whose header TAG equals VALUE. May be repeated.")
+        render.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                            help="Number of games rendered in parallel. Defaults to the number of CPUs.")
+        render.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l",
+                            help="Render quality, as in manim's -q flag. Defaults to 'l'.")
+        render.add_argument("-o", "--output", default="chess_videos", help="Directory for the videos.")
+        render.add_argument("--timeout", type=float, default=None, help="Seconds allowed per render attempt.")
+        render.add_argument("--retries", type=int, default=1, help="Retries for a failed render. Defaults to 1.")
+        render.add_argument("--split", type=int, default=None, metavar="SEGMENTS",
+                            help="Render games one at a time, splitting each game into SEGMENTS ply ranges "
+                                 "rendered in parallel and joined losslessly. Suited to long games.")
+        render.add_argument("--condense", type=int, default=None, metavar="PLIES",
+                            help="Play PLIES plies per animation call instead of one, which produces far "
+                                 "fewer partial movie files. Suited to games with many plies.")
+        render.add_argument("--share-openings", action="store_true",
+                            help="Render the opening moves shared by several games only once, caching them "
+                                 "for later runs, and join every video from its segments. Suited to opening "
+                                 "repertoires and databases of games from the same openings.")
+        render.set_defaults(handler=self.render)
+
+        export = commands.add_parser("export", help="Draw diagram images of many positions.")
+        export.add_argument("source", help="A FEN or EPD list with one position per line, or a PGN file "
+                                           "whose every mainline position is drawn.")
+        export.add_argument("-o", "--output", default="chess_diagrams",
+                            help="Directory for the diagrams and their manifest.")
+        export.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                            help="Number of worker processes. Defaults to the number of CPUs.")
+        export.add_argument("--size", type=int, default=480, help="Side length of the diagrams in pixels.")
+        export.add_argument("--format", default="png", help="Image format, as a file extension. Defaults to png.")
+        export.add_argument("--flipped", action="store_true", help="Show the boards from Black's side.")
+        export.add_argument("--no-labels", action="store_true", help="Leave out the rank and file labels.")
+        export.add_argument("--force", action="store_true",
+                            help="Redraw every diagram, even if it is unchanged since the last run.")
+        export.set_defaults(handler=self.export)
+
+    def run(self, argv=None):
+        """
+        Parses the arguments and runs the selected command.
+
+        Args:
+            argv (list, optional): The command line arguments. Defaults to sys.argv[1:].
+
+        Returns:
+            int: The exit code.
+        """
+        args = self.parser.parse_args(argv)
+        return args.handler(args)
+
+    def select_games(self, args):
+        """
+        Builds a render job for every selected game.
+
+        Args:
+            args (argparse.Namespace): The parsed render arguments.
+
+        Returns:
+            list: The RenderJob objects.
+        """
+        from ..pgn import PGNIndex
+
+        where = {}
+        for condition in args.where:
+            tag, separator, value = condition.partition("=")
+            if not separator:
+                self.parser.error(f"--where expects TAG=VALUE, got {condition!r}")
+            where[tag] = value
+        try:
+            selection = parse_selection(args.games) if args.games else None
+        except ValueError:
+            self.parser.error(f"Invalid game selection: {args.games!r}")
+
+        jobs = []
+        for pgn_path in find_pgn_files(args.source):
+            index = PGNIndex(pgn_path)
+            stem = os.path.splitext(os.path.basename(pgn_path))[0]
+            for game_id in index.find(where or None):
+                if selection is not None and game_id not in selection:
+                    continue
+                name = f"{stem}-{game_id:05d}"
+                output = os.path.join(args.output, f"{name}.mp4")
+                jobs.append(RenderJob(name, render_game, (pgn_path, game_id, output, args.quality, args.condense),
+                                      output))
+        return jobs
+
+    def render(self, args):
+        """
+        Renders the selected games in a process pool and writes a summary report.
+
+        Args:
+            args (argparse.Namespace): The parsed render arguments.
+
+        Returns:
+            int: 0 if every game rendered, 1 otherwise.
+        """
+        jobs = self.select_games(args)
+        if not jobs:
+            print("No games selected.")
+            return 1
+
+        if args.split and args.share_openings:
+            self.parser.error("--split and --share-openings cannot be combined")
+
+        print(f"Rendering {len(jobs)} games with {args.workers} workers")
+
+        def report(result):
+            status = "ok" if result["status"] == "ok" else "FAILED"
+            print(f"  {status:6} {result['name']} ({result['seconds']:.1f}s, attempts: {result['attempts']})")
+
+        if args.split:
+            results = []
+            for job in jobs:
+                results.append(self.render_split(job, args))
+                report(results[-1])
+        elif args.share_openings:
+            results = self.render_shared(jobs, args, report)
+        else:
+            results = run_jobs(jobs, workers=args.workers, timeout=args.timeout,
+                               retries=args.retries, on_result=report)
+        failed = [result for result in results if result["status"] != "ok"]
+
+        os.makedirs(args.output, exist_ok=True)
+        summary_path = os.path.join(args.output, "summary.json")
+        with open(summary_path, "w") as summary_file:
+            json.dump({"rendered": len(results) - len(failed), "failed": len(failed), "jobs": results},
+                      summary_file, indent=2)
+
+        print(f"Rendered {len(results) - len(failed)}/{len(results)} games, summary in {summary_path}")
+        for result in failed:
+            print(f"\n{result['name']} failed:\n{result['error']}")
+        return 1 if failed else 0
+
+    def export(self, args):
+        """
+        Draws diagrams of the positions of a file, skipping the ones unchanged since the last run.
+
+        Args:
+            args (argparse.Namespace): The parsed export arguments.
+
+        Returns:
+            int: 0 if every diagram was drawn, 1 otherwise.
+        """
+        from ..export import export_diagrams, read_positions
+
+        options = {"size": args.size, "flipped": args.flipped, "labels": not args.no_labels}
+        start = time.monotonic()
+        summary = export_diagrams(read_positions(args.source), args.output, options, image_format=args.format,
+                                  workers=args.workers, force=args.force)
+        print(f"Drew {summary['written']} diagrams, skipped {summary['skipped']} unchanged, "
+              f"{summary['failed']} failed in {time.monotonic() - start:.1f}s")
+        for name, error in summary["errors"].items():
+            print(f"\n{name} failed:\n{error}")
+        return 1 if summary["failed"] else 0
+
+    def render_split(self, job, args):
+        """
+        Renders one game split into ply ranges across the worker pool.
+
+        Args:
+            job (RenderJob): The render_game job of the game.
+            args (argparse.Namespace): The parsed render arguments.
+
+        Returns:
+            dict: The result of the job, shaped like the results of run_jobs.
+        """
+        start = time.monotonic()
+        error = None
+        try:
+            pgn_path, game_id, output, quality, plies_per_play = job.args
+            render_game_split(pgn_path, game_id, output, quality, segments=args.split, workers=args.workers,
+                              timeout=args.timeout, retries=args.retries, plies_per_play=plies_per_play)
+        except Exception:
+            error = traceback.format_exc()
+        return {
+            "name": job.name, "status": "ok" if error is None else "failed", "attempts": 1,
+            "seconds": round(time.monotonic() - start, 3), "output": job.output, "error": error,
+        }
+
+    def render_shared(self, jobs, args, report):
+        """
+        Renders the selected games, rendering their shared opening moves only once.
+
+        Args:
+            jobs (list): The render_game jobs of the games.
+            args (argparse.Namespace): The parsed render arguments.
+            report (callable): Called with each result as soon as its game is rendered.
+
+        Returns:
+            list: The results of the jobs, shaped like the results of run_jobs.
+        """
+        from ..pgn import PGNIndex
+
+        games, indexes = [], {}
+        for job in jobs:
+            pgn_path, game_id, output, _, _ = job.args
+            index = indexes.setdefault(pgn_path, PGNIndex(pgn_path))
+            headers, moves = index.read_game(game_id)
+            games.append((job.name, headers.get("FEN"), moves, output))
+        results = render_games_shared(games, args.quality, workers=args.workers, timeout=args.timeout,
+                                      retries=args.retries, plies_per_play=args.condense, on_result=report)
+        segments = sum(result["segments"] for result in results)
+        cached = sum(result["cached"] for result in results)
+        print(f"Joined {segments} segments, {cached} of them from the segment cache")
+        return results
+
+
+def main(argv=None):
+    return ManimChessCLI().run(argv)
 
 
 if __name__ == "__main__":
-    cli = ManimChessCLI()
\ No newline at end of file
+    sys.exit(main())
@@ -1,15 +1,228 @@
-from manim import Mobject, ManimColor, ImageMobject
+from manim import Mobject, ManimColor, ImageMobject, config
+from manim.constants import DEFAULT_QUALITY, QUALITIES
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.utils.images import get_full_raster_image_path
+from collections import OrderedDict
+from PIL import Image
+import hashlib
+import logging
+import math
+import numpy as np
 import os
+from .. import profiling
+from ..cache import cache_dir
+
+logger = logging.getLogger(__name__)
 
 module_dir = os.path.dirname(__file__)
 parent_module_dir = os.path.dirname(module_dir)
 data_dir = os.path.join(parent_module_dir, 'images')
 
+# FEN symbols of the pieces, lowercase as for black pieces.
+PIECE_SYMBOLS = {
+    "pawn": "p", "knight": "n", "bishop": "b", "rook": "r", "queen": "q", "king": "k"
+}
+
+# Maximum number of decoded piece images kept in memory at once.
+IMAGE_CACHE_SIZE = 32
+_image_cache = OrderedDict()
+_source_sizes = {}
+
+# Piece images are laid out as if rendered at this pixel height, then scaled by PIECE_SCALE.
+DEFAULT_RESOLUTION = QUALITIES[DEFAULT_QUALITY]["pixel_height"]
+PIECE_SCALE = 0.5
+# Pre-scaled piece rasters are made in steps of this many pixels.
+RASTER_STEP = 16
+
+
+def piece_image_path(path, color_str, piece_name):
+    """
+    Returns the full path of a piece image.
+
+    Args:
+        path (str): The file path to the piece image, or an empty string for the default image.
+        color_str (str): The piece color, either "white" or "black".
+        piece_name (str): The name of the chess piece (e.g., "pawn", "king").
+
+    Returns:
+        str: The full path of the image file.
+    """
+    return str(get_full_raster_image_path(path or os.path.join(data_dir, f"{color_str}-{piece_name}")))
+
+
+def source_size(image_path):
+    """
+    Returns the size of an image, reading only its header.
+
+    Args:
+        image_path (str): The full path of the image file.
+
+    Returns:
+        tuple: The width and height of the image in pixels.
+    """
+    size = _source_sizes.get(image_path)
+    if size is None:
+        with Image.open(image_path) as image:
+            size = _source_sizes[image_path] = image.size
+    return size
+
+
+def raster_height(source_height, pixel_height):
+    """
+    Returns the height of the piece raster matching the pixels a piece covers in the output.
+
+    Args:
+        source_height (int): The height of the source image in pixels.
+        pixel_height (int): The pixel height of the rendered frames.
+
+    Returns:
+        int: The raster height, rounded up to a multiple of RASTER_STEP and never above the source height.
+    """
+    shown = source_height * PIECE_SCALE * pixel_height / DEFAULT_RESOLUTION
+    return min(source_height, max(RASTER_STEP, RASTER_STEP * math.ceil(shown / RASTER_STEP)))
+
+
+def load_raster(image_path, height):
+    """
+    Returns a piece image scaled down to `height`, from the on-disk raster cache if possible.
+
+    Scaled rasters are stored as PNG files in cache_dir("pieces"), keyed by the image path,
+    its modification time and the height.
+
+    Args:
+        image_path (str): The full path of the source image.
+        height (int): The height of the raster in pixels.
+
+    Returns:
+        numpy.ndarray: The RGBA pixel array of the raster.
+    """
+    stat = os.stat(image_path)
+    digest = hashlib.sha1(f"{os.path.abspath(image_path)}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    raster_path = os.path.join(cache_dir("pieces"), f"{stem}-{digest}-{height}.png")
+    try:
+        with Image.open(raster_path) as raster:
+            profiling.count("rasters_loaded")
+            return np.array(raster.convert("RGBA"))
+    except OSError:
+        pass
+
+    profiling.count("rasters_built")
+    with Image.open(image_path) as source:
+        source = source.convert("RGBA")
+        width = max(1, round(source.width * height / source.height))
+        raster = source.resize((width, height), Image.LANCZOS)
+    temp_path = f"{raster_path}.{os.getpid()}.tmp"
+    try:
+        raster.save(temp_path, format="PNG")
+        os.replace(temp_path, raster_path)
+    except OSError as error:
+        logger.warning("Could not cache piece raster %s: %s", raster_path, error)
+    return np.array(raster)
+
+
+def load_piece_image(path, color_str, piece_name, height=None):
+    """
+    Returns the decoded RGBA pixel array of a piece image, decoding each image only once.
+
+    Decoded images are kept in a process-wide LRU cache keyed by (path, color, piece name, height).
+    The returned array is shared by every caller and marked read-only.
+
+    Args:
+        path (str): The file path to the piece image, or an empty string for the default image.
+        color_str (str): The piece color, either "white" or "black".
+        piece_name (str): The name of the chess piece (e.g., "pawn", "king").
+        height (int, optional): The height of a pre-scaled raster, see `load_raster`.
+                                Defaults to the source image.
+
+    Returns:
+        numpy.ndarray: The read-only RGBA pixel array of the image.
+    """
+    key = (path, color_str, piece_name, height)
+    pixel_array = _image_cache.get(key)
+    if pixel_array is not None:
+        _image_cache.move_to_end(key)
+        profiling.count("image_cache_hits")
+        return pixel_array
+
+    image_path = piece_image_path(path, color_str, piece_name)
+    with profiling.timer("image_decode"):
+        if height is None or height >= source_size(image_path)[1]:
+            profiling.count("images_decoded")
+            pixel_array = np.array(Image.open(image_path).convert("RGBA"))
+        else:
+            pixel_array = load_raster(image_path, height)
+    pixel_array.setflags(write=False)
+
+    _image_cache[key] = pixel_array
+    while len(_image_cache) > IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
+    return pixel_array
+
+
+def clear_image_cache():
+    """
+    Drops every decoded piece image from the cache.
+    """
+    _image_cache.clear()
+
+
+class SharedImageMobject(ImageMobject):
+    """
+    An ImageMobject displaying a shared, read-only pixel array without copying it.
+
+    The pixel array is only copied the first time it is modified in place,
+    e.g. by set_color or set_opacity.
+    """
+
+    def __init__(self, pixel_array, scale_to_resolution=QUALITIES[DEFAULT_QUALITY]["pixel_height"], path=None,
+                 **kwargs):
+        """
+        Initializes a SharedImageMobject from an already decoded RGBA pixel array.
+
+        Args:
+            pixel_array (numpy.ndarray): The RGBA pixel array to display.
+            scale_to_resolution (int, optional): The resolution at which the image is placed pixel by pixel.
+            path (str, optional): The image file the pixel array was decoded from, if any.
+            **kwargs: Additional keyword arguments for the AbstractImageMobject superclass.
+        """
+        # The attributes ImageMobject.__init__ would set, without decoding or copying the image
+        self.fill_opacity = 1
+        self.stroke_opacity = 1
+        self.invert_image = False
+        self.image_mode = "RGBA"
+        self.path = path
+        self.pixel_array = pixel_array
+        self.orig_alpha_pixel_array = pixel_array[:, :, 3]
+        AbstractImageMobject.__init__(self, scale_to_resolution, **kwargs)
+
+    def own_pixel_array(self):
+        """
+        Replaces the shared pixel array with a private, writable copy if needed.
+        """
+        if not self.pixel_array.flags.writeable:
+            self.pixel_array = self.pixel_array.copy()
+        return self
+
+    def set_color(self, *args, **kwargs):
+        self.own_pixel_array()
+        return super().set_color(*args, **kwargs)
+
+    def set_opacity(self, alpha):
+        self.own_pixel_array()
+        return super().set_opacity(alpha)
+
+
 class ChessPiece(Mobject):    
+    @profiling.timed("piece_init")
     def __init__(self, color: ManimColor, piece_name: str, path="", **kwargs):
         """
         Initializes a ChessPiece object with the specified color and piece name.
 
+        The piece image is taken from the shared image cache, so every piece of the same
+        type and color displays the same decoded pixel buffer. The image is pre-scaled to
+        the pixel height of the render, so that it is barely resampled per frame.
+
         Args:
             color (ManimColor): The color of the chess piece (WHITE or BLACK).
             piece_name (str): The name of the chess piece (e.g., "pawn", "king").
@@ -17,14 +230,30 @@ class ChessPiece(Mobject):
             **kwargs: Additional keyword arguments for the Mobject superclass.
         """
         super().__init__(**kwargs)
+        profiling.count("pieces_created")
         self.color = color
+        self.piece_name = piece_name
         if str(color)=="#FFFFFF":
             color_str = "white"
         else:
             color_str = "black"
+        self.color_str = color_str
+        self.path = path
 
-        default_path = os.path.join(data_dir, f"{color_str}-{piece_name}")
-        self.add(ImageMobject(path or default_path).scale(0.5))
+        # Use the raster matching the output resolution, laid out to cover the same area as the source image
+        image_path = piece_image_path(path, color_str, piece_name)
+        source_height = source_size(image_path)[1]
+        pixel_array = load_piece_image(path, color_str, piece_name, raster_height(source_height, config.pixel_height))
+        scale_to_resolution = DEFAULT_RESOLUTION * pixel_array.shape[0] / source_height
+        self.add(SharedImageMobject(pixel_array, scale_to_resolution, path=image_path).scale(PIECE_SCALE))
+
+    @property
+    def symbol(self):
+        """
+        str: The FEN symbol of the piece, uppercase for white pieces (e.g., 'K' or 'p').
+        """
+        symbol = PIECE_SYMBOLS[self.piece_name]
+        return symbol.upper() if self.color_str == "white" else symbol
 
 
 class Pawn(ChessPiece):
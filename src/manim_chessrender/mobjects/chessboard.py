@@ -1,30 +1,82 @@
 from manim import WHITE, GREEN, BLACK, Group, Mobject, Square, UP,\
 DOWN, LEFT, RIGHT, Text, AnimationGroup, ManimColor, ImageMobject,\
-FadeOut, FadeIn
+FadeIn, ORIGIN
 import chess, chess.pgn
+import numpy as np
 import os
-from .chess_piece import Queen, King, Pawn, Rook, Bishop, Knight
+from contextlib import contextmanager
+from .. import profiling
+from ..chess_utils import board_from_fen, index_to_position, position_to_index
+from ..animations import PieceSlide, PieceFadeOut
+from ..pgn import iter_games
+from ..plan import SLIDE, FADE, SPAWN, BANNER, compile_moves
+from .glyph_atlas import get_glyph
+from .chess_piece import ChessPiece, Queen, King, Pawn, Rook, Bishop, Knight
 # Define paths relative to the current file
 module_dir = os.path.dirname(__file__)
 parent_module_dir = os.path.dirname(module_dir)
 
 data_dir = os.path.join(parent_module_dir, 'images')
 
+# Prebuilt squares and labels shared by boards with the same look,
+# keyed by (square colors, line color, label font, label mode).
+_board_templates = {}
+
+
+def clear_board_templates():
+    """
+    Drops every cached board template.
+    """
+    _board_templates.clear()
+
+
+# Piece classes by lowercase FEN symbol.
+PIECE_CLASSES = {'p': Pawn, 'n': Knight, 'b': Bishop, 'r': Rook, 'q': Queen, 'k': King}
+
+
+def compute_square_centers(center=ORIGIN, square_size=1.0):
+    """
+    Computes the centers of all 64 squares of a board in a single NumPy operation.
+
+    Args:
+        center (numpy.ndarray, optional): The center of the board. Defaults to ORIGIN.
+        square_size (float, optional): The side length of a square. Defaults to 1.0.
+
+    Returns:
+        numpy.ndarray: An (8, 8, 3) array of square centers indexed by [rank, file],
+        so that the flattened array is indexed like the board elements (a1=0, h8=63).
+    """
+    offsets = np.arange(8) - 3.5
+    grid = np.zeros((8, 8, 3))
+    grid[:, :, 0] = offsets[np.newaxis, :]
+    grid[:, :, 1] = offsets[:, np.newaxis]
+    return np.asarray(center) + square_size * grid
+
 
 class ChessBoard(Group):
     """
     A class representing a chessboard with pieces.
 
     Attributes:
-        elements (list): A list containing the Mobject instances for the 64 squares.
+        elements (list): The piece mobject on each of the 64 squares, or None for empty squares.
+        piece_codes (bytearray): The FEN symbol code (ord) of the piece on each square, 0 for empty squares.
         square_colors (tuple): A tuple containing the colors of the squares.
         line_color (color): The color of the lines.
         strict_mode (bool): A flag for strict mode.
         squares (dict): A dictionary mapping positions to their respective Square objects.
         chessboard (chess.Board): A chess board object from the python-chess library.
+        label_font (str): The font used for the rank and file labels.
+        label_mode (str): How labels are built, "text" for one Text per label or "atlas" for shared glyphs.
+        square_centers (numpy.ndarray): An (8, 8, 3) array of square centers indexed by [rank, file].
+        square_size (float): The side length of a square.
+        flipped (bool): Whether the board is seen from Black's side.
+        game_moves (list): The moves of the game loaded with `load_game`, or None.
+        game_plan (list): The compiled plies of the game loaded with `load_game`, or None.
+        banner (Text): The last banner shown over the board, such as "Checkmate!", or None.
     """
 
-    def __init__(self, square_colors=(WHITE, GREEN), line_color=BLACK, strict_mode=True, **kwargs):
+    def __init__(self, square_colors=(WHITE, GREEN), line_color=BLACK, strict_mode=True,
+                 label_font="Ubuntu Mono", label_mode="text", **kwargs):
         """
         Initializes the ChessBoard with the given square colors, line color, and strict mode flag.
 
@@ -32,48 +84,142 @@ class ChessBoard(Group):
             square_colors (tuple, optional): Colors of the squares. Defaults to (WHITE, GREEN).
             line_color (color, optional): Color of the lines. Defaults to BLACK.
             strict_mode (bool, optional): Flag for strict mode. Defaults to True.
+            label_font (str, optional): Font of the rank and file labels. Defaults to "Ubuntu Mono".
+            label_mode (str, optional): "text" to lay out every label with Text, or "atlas" to reuse
+                                        glyphs rendered once per font and color. Defaults to "text".
             **kwargs: Additional keyword arguments passed to the Group superclass.
         """
         super().__init__(**kwargs)
 
-        self.elements = [Mobject() for _ in range(64)]
+        self.elements = [None] * 64
+        self.piece_codes = bytearray(64)
         self.square_colors = square_colors
         self.line_color = line_color
         self.strict_mode = strict_mode
-        self.squares = {f'{row}{col}': Square(stroke_color=line_color).scale(0.5)
-                        for row in 'abcdefgh' for col in range(1, 9)}
+        self.label_font = label_font
+        if label_mode not in ("text", "atlas"):
+            raise ValueError(f"Invalid label mode: {label_mode}")
+        self.label_mode = label_mode
+        self.flipped = False
+        self.square_centers = compute_square_centers()
+        self.square_size = 1.0
 
         self.chessboard = chess.Board()
-        self.position_squares()
-        self.color_squares()
-        self.add_labels()
+        self.game_moves = None
+        self.game_plan = None
+        self.banner = None
+        self.board = None
+        self._grouped = [None] * 64
+        self._dirty = set()
+        self._defer_depth = 0
+        self.build_from_template()
         self.group_elements()
 
+    def template_key(self):
+        """
+        Returns the key identifying the board template shared by boards that look the same.
+
+        Returns:
+            tuple: The square colors, line color, label font and label mode of the board.
+        """
+        return (tuple(str(color) for color in self.square_colors), str(self.line_color),
+                self.label_font, self.label_mode)
+
+    def build_from_template(self):
+        """
+        Builds the squares and labels of the board.
+
+        The first board with a given template key lays out, colors and labels its squares
+        from scratch and stores a copy of the result. Later boards copy that template
+        instead of rebuilding it.
+        """
+        key = self.template_key()
+        template = _board_templates.get(key)
+        if template is None:
+            profiling.count("board_templates_built")
+            self.squares = {f'{row}{col}': Square(stroke_color=self.line_color).scale(0.5)
+                            for row in 'abcdefgh' for col in range(1, 9)}
+            self.position_squares()
+            self.color_squares()
+            self.add_labels()
+            _board_templates[key] = (
+                {name: square.copy() for name, square in self.squares.items()},
+                [label.copy() for label in self.labels],
+            )
+            return
+
+        squares, labels = template
+        self.squares = {name: square.copy() for name, square in squares.items()}
+        self.labels = [label.copy() for label in labels]
+
     def position_squares(self):
         """
         Positions the squares on the board in their correct locations.
         """
-        self.squares['e5'].move_to(UP * 0.5 + RIGHT * 0.5)
+        for name, square in self.squares.items():
+            square.move_to(self.square_center(name))
+
+    def square_center(self, square):
+        """
+        Returns the center of a square from the precomputed square centers.
 
-        for i in range(4, 0, -1):
-            self.squares[f'e{i}'].next_to(
-                self.squares[f'e{i + 1}'], DOWN, buff=0)
-        for i in range(6, 9):
-            self.squares[f'e{i}'].next_to(
-                self.squares[f'e{i - 1}'], UP, buff=0)
+        Args:
+            square (str | int): The board position (e.g., 'e4') or its index (0-63).
 
-        for row in 'dcba':
-            self.squares[f'{row}1'].next_to(
-                self.squares[f'{chr(ord(row) + 1)}1'], LEFT, buff=0)
-        for row in 'fg':
-            self.squares[f'{row}1'].next_to(
-                self.squares[f'{chr(ord(row) - 1)}1'], RIGHT, buff=0)
-        self.squares['h1'].next_to(self.squares['g1'], RIGHT, buff=0)
+        Returns:
+            numpy.ndarray: The center of the square.
+        """
+        index = self.position_to_index(square) if isinstance(square, str) else square
+        return self.square_centers[index // 8, index % 8]
 
-        for row in 'abcdefgh':
-            for col in range(2, 9):
-                self.squares[f'{row}{col}'].next_to(
-                    self.squares[f'{row}{col - 1}'], UP, buff=0)
+    def flip(self):
+        """
+        Rotates the board by 180 degrees, switching the side it is seen from.
+
+        The square centers are transformed directly instead of rebuilding the board;
+        the squares, labels and pieces are then moved to their new centers.
+        """
+        self.flipped = not self.flipped
+        self.square_centers = self.square_centers[::-1, ::-1].copy()
+        self.position_squares()
+        self.position_labels()
+        for index, element in enumerate(self.elements):
+            if element is not None:
+                element.move_to(self.square_center(index))
+
+    def move_board(self, center=ORIGIN, square_size=1.0):
+        """
+        Moves and resizes the board, with its labels and pieces.
+
+        Args:
+            center (numpy.ndarray, optional): The new center of the board. Defaults to ORIGIN.
+            square_size (float, optional): The new side length of a square. Defaults to 1.0.
+        """
+        self.sync_elements()
+        old_center = self.square_centers.mean(axis=(0, 1))
+        factor = square_size / self.square_size
+        self.board.scale(factor, about_point=old_center).shift(np.asarray(center) - old_center)
+        self.square_centers = np.asarray(center) + factor * (self.square_centers - old_center)
+        self.square_size = square_size
+
+    def position_labels(self):
+        """
+        Places the rank and file labels along the edges facing the viewer and
+        colors each label to contrast with the square it sits on.
+        """
+        color1, color2 = self.square_colors
+        edge_rank = '8' if self.flipped else '1'
+        edge_file = 'h' if self.flipped else 'a'
+        file_squares = [f'{letter}{edge_rank}' for letter in 'abcdefgh']
+        rank_squares = [f'{edge_file}{rank}' for rank in '12345678']
+        for label, position in zip(self.labels, file_squares + rank_squares):
+            index = self.position_to_index(position)
+            dark_square = (index // 8 + index % 8) % 2 == 0
+            label.set_color(color1 if dark_square else color2)
+            if position in file_squares:
+                label.move_to(self.square_center(position) + (DOWN + RIGHT) * 0.35 * self.square_size)
+            else:
+                label.move_to(self.square_center(position) + (UP + LEFT) * 0.35 * self.square_size)
 
     def color_squares(self):
         """
@@ -86,6 +232,7 @@ class ChessBoard(Group):
                 self.squares[f'{row}{col}'].set_fill(color, opacity=0.7)
             color1, color2 = color2, color1
 
+    @profiling.timed("add_labels")
     def add_labels(self):
         """
         Adds labels to the squares on the board indicating ranks and files.
@@ -94,20 +241,116 @@ class ChessBoard(Group):
         color1, color2 = self.square_colors
         for idx, letter in enumerate('abcdefgh'):
             color = color2 if idx % 2 == 1 else color1
-            self.labels.append(Text(letter, font="Ubuntu Mono", color=color).move_to(
-                self.squares[f'{letter}1'].get_center() + DOWN * 0.35 + RIGHT * 0.35).scale(0.3))
+            self.labels.append(self.make_label(letter, color).move_to(
+                self.square_center(f'{letter}1') + DOWN * 0.35 + RIGHT * 0.35).scale(0.3))
         for idx in range(1, 9):
             color = color1 if idx % 2 == 1 else color2
-            self.labels.append(Text(str(idx), font="Ubuntu Mono", color=color).move_to(
-                self.squares[f'a{idx}'].get_center() + UP * 0.35 + LEFT * 0.35).scale(0.3))
+            self.labels.append(self.make_label(str(idx), color).move_to(
+                self.square_center(f'a{idx}') + UP * 0.35 + LEFT * 0.35).scale(0.3))
 
+    def make_label(self, text, color):
+        """
+        Creates a single rank or file label according to the board's label mode.
+
+        Args:
+            text (str): The label text (e.g., 'a' or '1').
+            color (ManimColor): The label color.
+
+        Returns:
+            VMobject: The label mobject.
+        """
+        profiling.count("labels_created")
+        if self.label_mode == "atlas":
+            return get_glyph(text, self.label_font, color)
+        return Text(text, font=self.label_font, color=color)
+
+    @profiling.timed("group_elements")
     def group_elements(self):
         """
         Groups all the squares, labels, and elements into a single group and adds it to the board.
+
+        The group is created once; later calls replace its contents, so the same `board`
+        mobject can stay in a scene.
+        """
+        profiling.count("regroups")
+        if self.board is None:
+            self.board = Group()
+            self.add(self.board)
+        self.board.submobjects = []
+        self.board.add(*self.squares.values(), *self.labels,
+                       *[element for element in self.elements if element is not None])
+        self._grouped = list(self.elements)
+        self._dirty.clear()
+
+    @profiling.timed("sync_elements")
+    def sync_elements(self, indices=None):
+        """
+        Updates the board group for the element slots whose mobject changed since they were grouped.
+
+        Args:
+            indices (iterable, optional): The element indices to check. Defaults to all 64 squares.
+        """
+        profiling.count("partial_regroups")
+        for index in range(64) if indices is None else indices:
+            old, new = self._grouped[index], self.elements[index]
+            if old is new:
+                continue
+            # A piece that moved to another slot is still on the board
+            if old is not None and not any(element is old for element in self.elements):
+                self.board.remove(old)
+            if new is not None:
+                self.board.add(new)
+            self._grouped[index] = new
+
+    @contextmanager
+    def deferred_grouping(self):
+        """
+        Defers updating the board group until the block exits.
+
+        Only the element slots changed inside the block are regrouped, once, on exit.
+
+        Example:
+            with chessboard.deferred_grouping():
+                chessboard.add_element('e1', King(WHITE))
+                chessboard.add_element('e8', King(BLACK))
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0:
+                self.sync_elements(sorted(self._dirty))
+                self._dirty.clear()
+
+    def update_group(self, indices):
+        """
+        Brings the board group up to date for the given element slots, or marks them for
+        regrouping when grouping is deferred.
+
+        Args:
+            indices (iterable): The element indices whose mobject changed.
+        """
+        self._dirty.update(indices)
+        if not self._defer_depth:
+            self.sync_elements(sorted(self._dirty))
+            self._dirty.clear()
+
+    def group_animations(self, animations):
         """
-        self.board = Group(*self.squares.values(), *
-                           self.labels, *self.elements)
-        self.add(self.board)
+        Groups the animations of a move around the board group.
+
+        A played animation group adds its mobject to the scene, and a new group of the moved
+        pieces would break the board group up into loose squares and pieces. The board group
+        is used as the mobject instead, so playing the move adds nothing to the scene.
+
+        Args:
+            animations (list): The animations of the move.
+
+        Returns:
+            AnimationGroup: The grouped animations.
+        """
+        return AnimationGroup(*animations, group=self.board)
 
     def index_to_position(self, index: int) -> str:
         """
@@ -119,11 +362,7 @@ class ChessBoard(Group):
         Returns:
         str: The corresponding chess board position.
         """
-        if not 0 <= index < 64:
-            raise ValueError("Index must be between 0 and 63")
-        row = index // 8
-        col = index % 8
-        return chr(col + ord('a')) + str(row + 1)
+        return index_to_position(index)
 
     def position_to_index(self, position: str) -> int:
         """
@@ -135,11 +374,18 @@ class ChessBoard(Group):
         Returns:
         int: The corresponding index.
         """
-        if len(position) != 2 or position[0] not in 'abcdefgh' or position[1] not in '12345678':
-            raise ValueError("Position must be in the format 'a1' to 'h8'")
-        col = ord(position[0]) - ord('a')
-        row = int(position[1]) - 1
-        return row * 8 + col
+        return position_to_index(position)
+
+    def set_element(self, index, piece):
+        """
+        Puts a piece mobject on a square, or empties the square, keeping the piece codes in sync.
+
+        Args:
+            index (int): The square index (0-63).
+            piece (Mobject): The piece mobject, or None to empty the square.
+        """
+        self.elements[index] = piece
+        self.piece_codes[index] = 0 if piece is None else ord(getattr(piece, "symbol", "?"))
 
     def add_element(self, position: str, piece_mobject: Mobject):
         """
@@ -150,11 +396,22 @@ class ChessBoard(Group):
             piece_mobject (Mobject): The graphical object representing the chess piece.
         """
         index = self.position_to_index(position)
-        square_position = self.squares[position].get_center()
+        square_position = self.square_center(position)
         piece = piece_mobject.move_to(square_position)
-        self.elements[index] = piece
-        self.group_elements()
-  
+        self.set_element(index, piece)
+        self.update_group([index])
+
+    def add_elements(self, placements):
+        """
+        Adds many chess pieces to the board, regrouping only the changed squares once.
+
+        Args:
+            placements (iterable): Pairs of (position, piece_mobject), e.g. [('e1', King(WHITE))].
+        """
+        with self.deferred_grouping():
+            for position, piece_mobject in placements:
+                self.add_element(position, piece_mobject)
+
     def handle_castling(self, move: chess.Move):
         """
         Handles castling moves on the board.
@@ -198,26 +455,22 @@ class ChessBoard(Group):
             chess.square_name(rook_start))
         rook_end_index = self.position_to_index(chess.square_name(rook_end))
         rook = self.elements[rook_start_index]
-        rook_end_square = self.squares[chess.square_name(
-            rook_end)].get_center()
-        rook_move_animation = rook.animate.move_to(rook_end_square)
-        animations.append(rook_move_animation)
-        self.elements[rook_end_index] = rook
-        self.elements[rook_start_index] = Mobject()
+        rook_end_square = self.square_center(rook_end)
+        self.set_element(rook_end_index, rook)
+        self.set_element(rook_start_index, None)
 
         # Move the king on the board
         king_start_index = self.position_to_index(
             chess.square_name(king_start))
         king_end_index = self.position_to_index(chess.square_name(king_end))
         king = self.elements[king_start_index]
-        king_end_square = self.squares[chess.square_name(
-            king_end)].get_center()
-        king_move_animation = king.animate.move_to(king_end_square)
-        animations.append(king_move_animation)
-        self.elements[king_end_index] = king
-        self.elements[king_start_index] = Mobject()
+        king_end_square = self.square_center(king_end)
+        self.set_element(king_end_index, king)
+        self.set_element(king_start_index, None)
+        self.update_group([rook_start_index, rook_end_index, king_start_index, king_end_index])
 
-        return AnimationGroup(*animations)
+        animations.append(PieceSlide((rook, rook_end_square), (king, king_end_square), group=self.board))
+        return self.group_animations(animations)
 
     def handle_en_passant(self, move: chess.Move):
         """
@@ -250,7 +503,7 @@ class ChessBoard(Group):
                 chess.square_name(captured_square))
             captured_piece = self.elements[captured_square_index]
 
-            capture_animation = FadeOut(captured_piece)
+            capture_animation = PieceFadeOut(captured_piece)
             animations.append(capture_animation)
 
             # Animating the capturing pawn move
@@ -260,15 +513,18 @@ class ChessBoard(Group):
             end_index = self.position_to_index(end_square)
 
             capturing_piece = self.elements[start_index]
-            end_square_center = self.squares[end_square].get_center()
-            move_animation = capturing_piece.animate.move_to(end_square_center)
+            end_square_center = self.square_center(end_square)
+            move_animation = PieceSlide((capturing_piece, end_square_center))
             animations.append(move_animation)
 
             # Remove captured piece from elements list and board
-            self.elements[captured_square_index] = Mobject()
+            self.set_element(captured_square_index, None)
+            self.set_element(end_index, capturing_piece)
+            self.set_element(start_index, None)
+            self.update_group([captured_square_index, start_index, end_index])
             self.chessboard.remove_piece_at(captured_square)
 
-            return AnimationGroup(*animations)
+            return self.group_animations(animations)
         else:
             raise ValueError(f"Invalid move: {move}")
 
@@ -297,28 +553,51 @@ class ChessBoard(Group):
 
         end_pos = chess.square_name(move.to_square)
         end_index = self.position_to_index(end_pos)
-        end_square = self.squares[end_pos].get_center()
+        end_square = self.square_center(end_pos)
 
         # Replace the pawn with the promoted piece
         # TODO: make promotion animation smoother
 
         promotion_piece = {
             '5': Queen, '4': Rook, '3': Bishop, '2': Knight
-        }.get(str(move.promotion), Queen)(pawn_piece.color)
+        }.get(str(move.promotion), Queen)(pawn_piece.color).scale(self.square_size)
+
+        captured_piece = self.elements[end_index]
+        if captured_piece is not None:
+            animations.append(PieceFadeOut(captured_piece))
 
-        promotion_animation = pawn_piece.animate.move_to(end_square)
+        promotion_animation = PieceSlide((pawn_piece, end_square))
         animations.append(promotion_animation)
 
-        capture_animation = FadeOut(pawn_piece)
+        capture_animation = PieceFadeOut(pawn_piece)
         animations.append(capture_animation)
 
         promotion_piece.move_to(end_square)
         final_animation = FadeIn(promotion_piece)
         animations.append(final_animation)
 
-        self.elements[end_index] = promotion_piece
-        return AnimationGroup(*animations)
+        self.set_element(start_index, None)
+        self.set_element(end_index, promotion_piece)
+        self.update_group([start_index, end_index])
+        return self.group_animations(animations)
 
+    def show_banner(self, text):
+        """
+        Creates a banner over the center of the board and keeps it in `banner`.
+
+        The banner is not part of the board group; fade it out with `FadeOut(chessboard.banner)`.
+
+        Args:
+            text (str): The text of the banner, such as "Checkmate!".
+
+        Returns:
+            FadeIn: The animation showing the banner.
+        """
+        self.banner = Text(text, font="Ubuntu Mono").scale(1.5 * self.square_size)
+        self.banner.move_to(self.square_centers.mean(axis=(0, 1)))
+        return FadeIn(self.banner)
+
+    @profiling.timed("execute_move")
     def execute_move(self, move: str):
         """
         Moves a piece on the board according to the given UCI move string.
@@ -335,8 +614,9 @@ class ChessBoard(Group):
 
         # Move using python-chess
         move = chess.Move.from_uci(move)
-        print(self.chessboard.legal_moves)
+        profiling.count("moves_executed")
 
+        profiling.count("legality_checks")
         if not (move in self.chessboard.legal_moves or self.strict_mode):
             raise ValueError(f"Invalid move: {move}")
 
@@ -345,13 +625,14 @@ class ChessBoard(Group):
 
         start_index = self.position_to_index(start_pos)
         end_index = self.position_to_index(end_pos)
-        end_square = self.squares[end_pos].get_center()
+        end_square = self.square_center(end_pos)
 
         # Handle pawn promotion
         if move.promotion:
             return self.handle_promotion(move)
 
         # Handle special moves (en passant or castling)
+        profiling.count("legality_checks")
         if move in self.chessboard.pseudo_legal_moves:
             if self.chessboard.is_en_passant(move):
                 return self.handle_en_passant(move)
@@ -367,27 +648,69 @@ class ChessBoard(Group):
         animations = []
 
         # Check if there's a piece at the end position
-        if target_piece != Mobject():
-            animations.append(FadeOut(target_piece))
+        if target_piece is not None:
+            animations.append(PieceFadeOut(target_piece))
 
-        self.elements[end_index] = piece
-        self.elements[start_index] = Mobject()
+        self.set_element(end_index, piece)
+        self.set_element(start_index, None)
+        self.update_group([start_index, end_index])
 
-        move_animation = piece.animate.move_to(end_square)
+        move_animation = PieceSlide((piece, end_square))
         animations.append(move_animation)
 
         if self.chessboard.is_checkmate():
             # Perform checkmate animation
-            checkmate_text = Text("Checkmate!", font="Ubuntu Mono").scale(1.5)
-            checkmate_text.move_to(self.board.get_center())
-            animations.append(FadeIn(checkmate_text))
+            animations.append(self.show_banner("Checkmate!"))
         elif self.chessboard.is_stalemate():
             # Perform stalemate animation
-            stalemate_text = Text("Stalemate!", font="Ubuntu Mono").scale(1.5)
-            stalemate_text.move_to(self.board.get_center())
-            animations.append(FadeIn(stalemate_text))
+            animations.append(self.show_banner("Stalemate!"))
+
+        return self.group_animations(animations)
 
-        return AnimationGroup(*animations)
+    @profiling.timed("apply_ply")
+    def apply_ply(self, ply):
+        """
+        Plays one ply compiled by `manim_chessrender.plan.compile_moves`.
+
+        The ply's operations are carried out as given, without any legality checks
+        or move analysis.
+
+        Args:
+            ply (PlyPlan): The compiled ply.
+
+        Returns:
+            AnimationGroup: An animation group showing the move.
+        """
+        profiling.count("plies_applied")
+        # Every operation refers to the occupancy before the ply
+        targets = [self.elements[op[1]] if op[0] in (SLIDE, FADE) else None for op in ply.ops]
+        animations = []
+
+        for op, piece in zip(ply.ops, targets):
+            if op[0] == FADE:
+                self.set_element(op[1], None)
+                animations.append(PieceFadeOut(piece))
+        for op, piece in zip(ply.ops, targets):
+            if op[0] == SLIDE:
+                self.set_element(op[1], None)
+        slides = []
+        for op, piece in zip(ply.ops, targets):
+            if op[0] == SLIDE:
+                self.set_element(op[2], piece)
+                slides.append((piece, self.square_center(op[2])))
+        if slides:
+            animations.append(PieceSlide(*slides, group=self.board))
+        for op in ply.ops:
+            if op[0] == SPAWN:
+                new_piece = self.create_piece(op[2]).move_to(self.square_center(op[1]))
+                self.set_element(op[1], new_piece)
+                animations.append(FadeIn(new_piece))
+            elif op[0] == BANNER:
+                animations.append(self.show_banner(op[1]))
+
+        self.update_group([op[1] for op in ply.ops if op[0] != BANNER] + [op[2] for op in ply.ops if op[0] == SLIDE])
+        self.chessboard.push(ply.move)
+        return self.group_animations(animations)
 
     def initialize_board(self, invert=False):
         """
@@ -411,77 +734,199 @@ class ChessBoard(Group):
         for letter in 'abcdefgh':
             position = f"{letter}2"
             index = self.position_to_index(position)
-            pawn = Pawn(clr1).move_to(self.squares[position].get_center())
-            self.elements[index] = pawn
+            pawn = Pawn(clr1).scale(self.square_size).move_to(self.square_center(position))
+            self.set_element(index, pawn)
 
         for piece, position in pieces:
-            chess_piece = piece(clr1).move_to(
-                self.squares[position].get_center())
+            chess_piece = piece(clr1).scale(self.square_size).move_to(
+                self.square_center(position))
             index = self.position_to_index(position)
-            self.elements[index] = chess_piece
+            self.set_element(index, chess_piece)
 
         for letter in 'abcdefgh':
             position = f"{letter}7"
             index = self.position_to_index(position)
-            pawn = Pawn(clr2).move_to(self.squares[position].get_center())
-            self.elements[index] = pawn
+            pawn = Pawn(clr2).scale(self.square_size).move_to(self.square_center(position))
+            self.set_element(index, pawn)
 
         for piece, position in pieces:
             new_position = position.replace('1', '8')
-            chess_piece = piece(clr2).move_to(
-                self.squares[new_position].get_center())
+            chess_piece = piece(clr2).scale(self.square_size).move_to(
+                self.square_center(new_position))
             index = self.position_to_index(new_position)
-            self.elements[index] = chess_piece
-        self.group_elements()
+            self.set_element(index, chess_piece)
+        self.sync_elements()
 
-    def load_fen(self, fen):
+    def create_piece(self, symbol):
+        """
+        Creates a chess piece mobject from its FEN symbol.
+
+        Args:
+            symbol (str): The FEN symbol of the piece, uppercase for white (e.g., 'N' or 'p').
+
+        Returns:
+            ChessPiece: The new piece, sized to the squares of the board.
+        """
+        color = WHITE if symbol.isupper() else BLACK
+        return PIECE_CLASSES[symbol.lower()](color).scale(self.square_size)
+
+    def load_fen(self, fen, incremental=False, animate=False):
         """
         Load a board position from a FEN string.
+
+        By default every piece mobject is rebuilt. In incremental mode the current placement is
+        compared with the target: pieces already on the right square are kept, pieces of the right
+        kind are moved from the nearest square they occupy, and only truly new pieces are created.
+
+        Args:
+            fen (str): The FEN string, or just its piece placement field.
+            incremental (bool, optional): If True, reuse the existing piece mobjects. Defaults to False.
+            animate (bool, optional): If True (incremental mode only), leave the pieces in place and
+                                      return an animation of the transition. Defaults to False.
+
+        Returns:
+            AnimationGroup: The transition animation when `animate` is True, otherwise None.
         """
-        self.elements = [Mobject() for _ in range(64)]
-
-        rows = fen.split()[0].split('/')
-        piece_map = {
-            'r': Rook, 'n': Knight, 'b': Bishop, 'q': Queen, 'k': King, 'p': Pawn,
-            'R': Rook, 'N': Knight, 'B': Bishop, 'Q': Queen, 'K': King, 'P': Pawn
-        }
-        colors = {
-            'r': BLACK, 'n': BLACK, 'b': BLACK, 'q': BLACK, 'k': BLACK, 'p': BLACK,
-            'R': WHITE, 'N': WHITE, 'B': WHITE, 'Q': WHITE, 'K': WHITE, 'P': WHITE
-        }
-
-        for rank_index, row in enumerate(rows):
-            file_index = 0
-            for char in row:
-                if char.isdigit():
-                    file_index += int(char)
-                else:
-                    position = f"{chr(ord('a') + file_index)}{8 - rank_index}"
-                    piece_class = piece_map[char]
-                    color = colors[char]
-                    chess_piece = piece_class(color).move_to(self.squares[position].get_center())
-                    index = self.position_to_index(position)
-                    self.elements[index] = chess_piece
-                    file_index += 1
+        self.chessboard = board_from_fen(fen)
+        placement = {square: piece.symbol() for square, piece in self.chessboard.piece_map().items()}
 
-        self.group_elements()
+        if incremental:
+            return self.apply_placement(placement, animate)
+
+        self.elements = [None] * 64
+        self.piece_codes = bytearray(64)
+        for index, symbol in placement.items():
+            self.set_element(index, self.create_piece(symbol).move_to(self.square_center(index)))
+        self.sync_elements()
+
+    def apply_placement(self, placement, animate=False):
+        """
+        Brings the piece mobjects to the given placement, reusing the pieces already on the board.
+
+        Args:
+            placement (dict): Maps square indices (0-63) to FEN piece symbols.
+            animate (bool, optional): If True, return an animation of the transition instead of
+                                      moving the pieces immediately. Defaults to False.
+
+        Returns:
+            AnimationGroup: The transition animation when `animate` is True, otherwise None.
+        """
+        current = {index: element for index, element in enumerate(self.elements)
+                   if isinstance(element, ChessPiece)}
+        target = {}
+
+        # Keep pieces that are already on the right square
+        for index, symbol in placement.items():
+            piece = current.get(index)
+            if piece is not None and piece.symbol == symbol:
+                target[index] = current.pop(index)
+
+        spare = {}
+        for index, piece in current.items():
+            spare.setdefault(piece.symbol, []).append((index, piece))
+
+        moved, spawned = [], []
+        for index, symbol in placement.items():
+            if index in target:
+                continue
+            candidates = spare.get(symbol)
+            if candidates:
+                nearest = min(range(len(candidates)),
+                              key=lambda k: chess.square_distance(candidates[k][0], index))
+                piece = candidates.pop(nearest)[1]
+                moved.append((piece, index))
+            else:
+                piece = self.create_piece(symbol).move_to(self.square_center(index))
+                spawned.append(piece)
+            target[index] = piece
+        removed = [piece for candidates in spare.values() for _, piece in candidates]
+
+        for index, element in enumerate(self.elements):
+            if index in target:
+                self.set_element(index, target[index])
+            elif element is not None:
+                self.set_element(index, None)
+        self.sync_elements()
+
+        if not animate:
+            for piece, index in moved:
+                piece.move_to(self.square_center(index))
+            return None
+
+        animations = []
+        if moved:
+            animations.append(PieceSlide(*[(piece, self.square_center(index)) for piece, index in moved],
+                                         group=self.board))
+        animations += [PieceFadeOut(piece) for piece in removed]
+        animations += [FadeIn(piece) for piece in spawned]
+        return self.group_animations(animations)
+
+    def load_game(self, moves, start_fen=None, ply=0):
+        """
+        Loads the moves of a game so that any of its positions can be reached with `seek`.
+
+        The moves are validated and compiled once; the plan is kept in `game_plan` for playback.
+
+        Args:
+            moves (iterable): The moves of the game, as chess.Move objects or UCI strings.
+            start_fen (str, optional): The FEN of the starting position. Defaults to the standard position.
+            ply (int, optional): The ply to show once the game is loaded. Defaults to 0, the starting position.
+
+        Raises:
+            ValueError: If a move is illegal or `ply` is out of range.
+        """
+        self.game_plan = compile_moves(moves, start_fen)
+        self.game_moves = [ply.move for ply in self.game_plan]
+        self.load_fen(start_fen or chess.STARTING_FEN, incremental=True)
+        self.seek(ply)
+
+    @property
+    def ply(self):
+        """
+        int: The number of plies played since the game or position was loaded.
+        """
+        return len(self.chessboard.move_stack)
+
+    def seek(self, ply):
+        """
+        Jumps to a ply of the game loaded with `load_game`, forward or backward, without animating.
+
+        Only the moves that differ from the current move stack are popped or pushed, then the
+        piece mobjects are brought to the new position in a single pass.
+
+        Args:
+            ply (int): The number of plies played in the position to show, 0 being the starting position.
+
+        Raises:
+            ValueError: If no game is loaded or `ply` is out of range.
+        """
+        if self.game_moves is None:
+            raise ValueError("No game loaded")
+        if not 0 <= ply <= len(self.game_moves):
+            raise ValueError(f"Ply must be between 0 and {len(self.game_moves)}")
+
+        stack = self.chessboard.move_stack
+        common = 0
+        while common < min(len(stack), ply) and stack[common] == self.game_moves[common]:
+            common += 1
+        while len(stack) > common:
+            self.chessboard.pop()
+        for move in self.game_moves[common:ply]:
+            self.chessboard.push(move)
+
+        placement = {square: piece.symbol() for square, piece in self.chessboard.piece_map().items()}
+        self.apply_placement(placement)
 
     def load_pgn_and_get_games(self, pgn_path):
         """
         Load all games from a PGN file and return a list of move arrays for each game.
 
+        Use `manim_chessrender.pgn.iter_games` to read games lazily, with their headers.
+
         Args:
             pgn_path (str): The path to the PGN file.
 
         Returns:
             list: A list of move arrays, each representing the moves of a single game.
         """
-        games = []
-        with open(pgn_path) as pgn_file:
-            while True:
-                game = chess.pgn.read_game(pgn_file)
-                if game is None:
-                    break
-                games.append(list(game.mainline_moves()))
-        return games
-
+        return [moves for _, moves in iter_games(pgn_path)]
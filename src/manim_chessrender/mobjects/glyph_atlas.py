@@ -0,0 +1,75 @@
+from manim import Text, VGroup, VMobject, config
+import numpy as np
+import hashlib
+import os
+
+# Glyph outlines shared by every board, keyed by (font, color, character).
+_glyph_cache = {}
+
+
+def glyph_cache_dir():
+    """
+    Returns the directory where glyph outlines are stored between runs.
+
+    Returns:
+        str: A directory inside manim's text directory.
+    """
+    return os.path.join(config.get_dir("text_dir"), "glyph_atlas")
+
+
+def clear_glyph_cache():
+    """
+    Drops every glyph kept in memory. Glyph outlines stored on disk are kept.
+    """
+    _glyph_cache.clear()
+
+
+def _glyph_path(char, font):
+    digest = hashlib.sha1(f"{font}\0{char}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(glyph_cache_dir(), f"{digest}.npz")
+
+
+def _load_outlines(char, font):
+    """
+    Loads the outlines of a glyph from disk, laying the glyph out with Text
+    and storing its outlines the first time it is requested.
+    """
+    path = _glyph_path(char, font)
+    if os.path.exists(path):
+        with np.load(path) as data:
+            return [data[f"arr_{idx}"] for idx in range(len(data.files))]
+
+    text = Text(char, font=font)
+    outlines = [mob.points.copy() for mob in text.family_members_with_points()]
+    try:
+        os.makedirs(glyph_cache_dir(), exist_ok=True)
+        with open(path, "wb") as glyph_file:
+            np.savez(glyph_file, *outlines)
+    except OSError:
+        pass
+    return outlines
+
+
+def get_glyph(char, font, color):
+    """
+    Returns a glyph mobject for a single character, laying it out at most once.
+
+    Glyphs are rendered once per (font, color) and kept in a process-wide cache;
+    their outlines are also stored on disk so later runs skip text layout entirely.
+
+    Args:
+        char (str): The character to render.
+        font (str): The font to render the character with.
+        color (ManimColor): The fill color of the glyph.
+
+    Returns:
+        VGroup: A fresh copy of the cached glyph, looking like Text(char, font=font, color=color).
+    """
+    key = (font, str(color), char)
+    glyph = _glyph_cache.get(key)
+    if glyph is None:
+        outlines = _load_outlines(char, font)
+        glyph = VGroup(*[VMobject().set_points(points) for points in outlines])
+        glyph.set_fill(color, opacity=1).set_stroke(width=0)
+        _glyph_cache[key] = glyph
+    return glyph.copy()
@@ -0,0 +1,340 @@
+from collections.abc import Mapping
+import chess, chess.pgn
+import heapq
+import io
+import itertools
+import json
+import logging
+import mmap
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+
+class MainlineBuilder(chess.pgn.HeadersBuilder):
+    """
+    A python-chess visitor collecting the headers and mainline moves of a game.
+
+    Variations are skipped. When the headers are rejected by `accept`, the movetext of
+    the game is skipped without being parsed and the result has no moves.
+    """
+
+    def __init__(self, accept=None):
+        """
+        Initializes the visitor.
+
+        Args:
+            accept (callable, optional): Called with the game headers; the game is skipped
+                                         when it returns False. Defaults to accepting every game.
+        """
+        super().__init__()
+        self.accept = accept
+
+    def end_headers(self):
+        self.moves = []
+        self.errors = []
+        self.skipped = self.accept is not None and not self.accept(self.headers)
+        return chess.pgn.SKIP if self.skipped else None
+
+    def begin_variation(self):
+        return chess.pgn.SKIP
+
+    def visit_move(self, board, move):
+        self.moves.append(move)
+
+    def handle_error(self, error):
+        logger.error("%s while parsing game %s vs %s", error,
+                     self.headers.get("White", "?"), self.headers.get("Black", "?"))
+        self.errors.append(error)
+
+    def result(self):
+        return self.headers, None if self.skipped else self.moves
+
+
+def header_matcher(where):
+    """
+    Turns a header filter into a predicate on game headers.
+
+    Args:
+        where (callable | dict | None): A predicate taking the headers, or a dictionary of
+                                        header values that must all match exactly.
+
+    Returns:
+        callable: The predicate, or None when every game matches.
+    """
+    if where is None or callable(where):
+        return where
+    if isinstance(where, Mapping):
+        return lambda headers: all(headers.get(tag) == value for tag, value in where.items())
+    raise TypeError(f"Invalid header filter: {where!r}")
+
+
+def iter_games(source, where=None, skip=0, limit=None, strict=False):
+    """
+    Lazily reads games from a PGN file, one game at a time.
+
+    Headers are read first; games rejected by the filter or skipped are passed over
+    without parsing their moves, so memory stays flat regardless of the file size.
+
+    Args:
+        source (str | file): The path to the PGN file, or a PGN file opened in text mode.
+        where (callable | dict, optional): A header filter, see `header_matcher`.
+        skip (int, optional): The number of matching games to skip. Defaults to 0.
+        limit (int, optional): The maximum number of games to yield. Defaults to all games.
+        strict (bool, optional): If True, raise the first error found while parsing a game, such as an
+                                 illegal move. Defaults to False, logging the error and yielding the moves
+                                 read before it.
+
+    Yields:
+        tuple: The headers (chess.pgn.Headers) and the list of mainline moves (chess.Move) of a game.
+
+    Raises:
+        ValueError: If `strict` is True and a game has a parse error.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as pgn_file:
+            yield from iter_games(pgn_file, where, skip, limit, strict)
+        return
+
+    matches = header_matcher(where)
+
+    def accept(headers):
+        nonlocal skip
+        if matches is not None and not matches(headers):
+            return False
+        if skip:
+            skip -= 1
+            return False
+        return True
+
+    builder = None
+
+    def make_builder():
+        nonlocal builder
+        builder = MainlineBuilder(accept)
+        return builder
+
+    count = 0
+    while limit is None or count < limit:
+        game = chess.pgn.read_game(source, Visitor=make_builder)
+        if game is None:
+            return
+        headers, moves = game
+        if moves is None:
+            continue
+        if strict and builder.errors:
+            raise builder.errors[0]
+        yield headers, moves
+        count += 1
+
+
+# A PGN tag pair on its own line, e.g. [White "Kasparov, Garry"].
+TAG_REGEX = re.compile(rb'^(?:\xef\xbb\xbf)?[ \t]*\[([A-Za-z0-9_+#=:-]+)[ \t]+"((?:[^"\\]|\\.)*)"[ \t]*\][ \t]*\r?$',
+                       re.MULTILINE)
+
+# The first line of a block of movetext: a line after an empty line that is neither a tag
+# pair nor an escaped or comment line. Matched up to the first character of the movetext.
+MOVETEXT_BLOCK_REGEX = re.compile(rb'\n[ \t]*\r?\n\s*(?=[^\s\[%;])')
+# Movetext at the very start of a file, after an optional byte order mark.
+LEADING_MOVETEXT_REGEX = re.compile(rb'(?:\xef\xbb\xbf)?\s*(?=[^\s\[%;])')
+
+
+def scan_game_offsets(pgn_path, tags):
+    """
+    Finds the byte offset and selected headers of every game in a PGN file in one pass.
+
+    The file is memory-mapped and scanned for tag pairs and blocks of movetext. A tag pair
+    that follows movetext starts a new game, and so does a block of movetext that follows
+    the movetext of the previous game, as for a game without headers. Moves are not parsed.
+
+    Args:
+        pgn_path (str): The path to the PGN file.
+        tags (tuple): The header names to collect.
+
+    Returns:
+        list: Pairs of (byte offset, list of header values in the order of `tags`).
+    """
+    games = []
+    with open(pgn_path, "rb") as pgn_file:
+        if os.fstat(pgn_file.fileno()).st_size == 0:
+            return games
+        with mmap.mmap(pgn_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            tag_matches = ((match.start(), match) for match in TAG_REGEX.finditer(data))
+            leading = LEADING_MOVETEXT_REGEX.match(data)
+            blocks = MOVETEXT_BLOCK_REGEX.finditer(data, leading.end() if leading else 0)
+            block_starts = ((match.end(), None) for match in itertools.chain([leading] if leading else [], blocks))
+            # previous_end: the end of the last tag pair; in_movetext: a movetext block followed it
+            previous_end, in_movetext = None, False
+            for offset, match in heapq.merge(tag_matches, block_starts, key=lambda item: item[0]):
+                after_movetext = in_movetext or (previous_end is not None and data[previous_end:offset].strip())
+                if not games or after_movetext:
+                    games.append((offset, [""] * len(tags)))
+                if match is None:
+                    in_movetext, previous_end = True, None
+                    continue
+                in_movetext, previous_end = False, match.end()
+                tag = match.group(1).decode("ascii")
+                if tag in tags:
+                    value = match.group(2).decode("utf-8", "replace")
+                    games[-1][1][tags.index(tag)] = value.replace('\\"', '"').replace("\\\\", "\\")
+    return games
+
+
+class PGNIndex:
+    """
+    A persistent index of game offsets and key headers for random access into a PGN file.
+
+    The index is stored in a sidecar file next to the PGN and rebuilt whenever the size
+    or modification time of the PGN changes.
+
+    Attributes:
+        pgn_path (str): The path to the PGN file.
+        index_path (str): The path to the sidecar index file.
+        offsets (list): The byte offset of every game.
+        entries (list): The indexed headers of every game, as dictionaries.
+    """
+
+    INDEX_TAGS = ("Event", "Date", "White", "Black", "Result", "ECO")
+    VERSION = 2
+
+    def __init__(self, pgn_path, index_path=None, rebuild=False):
+        """
+        Opens the index of a PGN file, building it if it is missing or stale.
+
+        Args:
+            pgn_path (str): The path to the PGN file.
+            index_path (str, optional): The path to the sidecar index. Defaults to the PGN path plus ".idx".
+            rebuild (bool, optional): If True, rebuild the index even if it is up to date. Defaults to False.
+        """
+        self.pgn_path = os.fspath(pgn_path)
+        self.index_path = index_path or self.pgn_path + ".idx"
+        if rebuild or not self.load():
+            self.build()
+            self.save()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _signature(self):
+        stat = os.stat(self.pgn_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def load(self):
+        """
+        Loads the sidecar index if it matches the current PGN file.
+
+        Returns:
+            bool: True if the index was loaded, False if it is missing or stale.
+        """
+        try:
+            with open(self.index_path) as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return False
+        size, mtime_ns = self._signature()
+        if (data.get("version") != self.VERSION or data.get("size") != size
+                or data.get("mtime_ns") != mtime_ns or tuple(data.get("tags", ())) != self.INDEX_TAGS):
+            return False
+        self.signature = (size, mtime_ns)
+        self.offsets = [offset for offset, _ in data["games"]]
+        self.entries = [dict(zip(self.INDEX_TAGS, values)) for _, values in data["games"]]
+        return True
+
+    def build(self):
+        """
+        Scans the PGN file and rebuilds the index in memory.
+        """
+        self.signature = self._signature()
+        games = scan_game_offsets(self.pgn_path, self.INDEX_TAGS)
+        self.offsets = [offset for offset, _ in games]
+        self.entries = [dict(zip(self.INDEX_TAGS, values)) for _, values in games]
+
+    def save(self):
+        """
+        Writes the index to its sidecar file. Failures to write are ignored.
+        """
+        size, mtime_ns = self.signature
+        data = {
+            "version": self.VERSION, "size": size, "mtime_ns": mtime_ns, "tags": list(self.INDEX_TAGS),
+            "games": [[offset, [entry[tag] for tag in self.INDEX_TAGS]]
+                      for offset, entry in zip(self.offsets, self.entries)],
+        }
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w") as index_file:
+                json.dump(data, index_file, separators=(",", ":"))
+            os.replace(temp_path, self.index_path)
+        except OSError as error:
+            logger.warning("Could not write PGN index %s: %s", self.index_path, error)
+
+    def find(self, where=None):
+        """
+        Returns the ids of the games whose headers match a filter.
+
+        Dictionary filters on tags outside INDEX_TAGS first narrow the games down by their
+        indexed tags, then read the headers of the remaining games from the file. Callable
+        filters receive the indexed headers only.
+
+        Args:
+            where (callable | dict, optional): A header filter, see `header_matcher`.
+
+        Returns:
+            list: The matching game ids, in file order.
+        """
+        matches = header_matcher(where)
+        if matches is None:
+            return list(range(len(self)))
+        if isinstance(where, Mapping) and not set(where) <= set(self.INDEX_TAGS):
+            candidates = self.find({tag: value for tag, value in where.items() if tag in self.INDEX_TAGS})
+            return [game_id for game_id, headers in self.headers(candidates) if matches(headers)]
+        return [game_id for game_id, entry in enumerate(self.entries) if matches(entry)]
+
+    def headers(self, game_ids):
+        """
+        Reads the full headers of several games, without parsing their moves.
+
+        Args:
+            game_ids (iterable): The ids of the games to read.
+
+        Yields:
+            tuple: The game id and headers (chess.pgn.Headers) of each game.
+        """
+        with open(self.pgn_path, "rb") as pgn_file:
+            for game_id in game_ids:
+                pgn_file.seek(self.offsets[game_id])
+                text = io.TextIOWrapper(pgn_file, encoding="utf-8-sig", errors="replace")
+                headers = chess.pgn.read_headers(text)
+                text.detach()
+                yield game_id, headers
+
+    def read_game(self, game_id):
+        """
+        Reads a single game by seeking directly to its offset.
+
+        Args:
+            game_id (int): The position of the game in the file, starting at 0.
+
+        Returns:
+            tuple: The headers (chess.pgn.Headers) and the list of mainline moves of the game.
+        """
+        for _, headers, moves in self.games([game_id]):
+            return headers, moves
+
+    def games(self, game_ids):
+        """
+        Reads several games by seeking directly to each of them.
+
+        Args:
+            game_ids (iterable): The ids of the games to read.
+
+        Yields:
+            tuple: The game id, headers and list of mainline moves of each game.
+        """
+        with open(self.pgn_path, "rb") as pgn_file:
+            for game_id in game_ids:
+                pgn_file.seek(self.offsets[game_id])
+                text = io.TextIOWrapper(pgn_file, encoding="utf-8-sig", errors="replace")
+                headers, moves = chess.pgn.read_game(text, Visitor=MainlineBuilder)
+                text.detach()
+                yield game_id, headers, moves
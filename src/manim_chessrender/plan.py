@@ -0,0 +1,138 @@
+from collections import namedtuple
+import chess
+from . import profiling
+
+# Primitive board operations, stored as tuples whose first item is the operation:
+#   (SLIDE, from_index, to_index)  slide the piece on from_index to to_index
+#   (FADE, index)                  fade out the piece on index and remove it
+#   (SPAWN, index, symbol)         fade in a new piece, given by its FEN symbol, on index
+#   (BANNER, text)                 show a banner such as "Checkmate!"
+# Square indices follow python-chess (a1=0, h8=63). All operations of a ply refer to the
+# occupancy before the ply and happen at the same time.
+SLIDE = "slide"
+FADE = "fade"
+SPAWN = "spawn"
+BANNER = "banner"
+
+# One compiled ply: the chess.Move played and the tuple of operations animating it.
+PlyPlan = namedtuple("PlyPlan", ["move", "ops"])
+
+
+def castling_squares(board, move):
+    """
+    Returns the squares a castling move takes the king and the rook from and to.
+
+    Handles both the standard (e1g1) and the king-takes-rook (e1h1) notation.
+
+    Args:
+        board (chess.Board): The position before the move.
+        move (chess.Move): The castling move.
+
+    Returns:
+        tuple: (king_from, king_to, rook_from, rook_to) square indices.
+    """
+    rank = chess.square_rank(move.from_square)
+    kingside = board.is_kingside_castling(move)
+    king_to = chess.square(6 if kingside else 2, rank)
+    rook_to = chess.square(5 if kingside else 3, rank)
+    if board.piece_type_at(move.to_square) == chess.ROOK:
+        rook_from = move.to_square
+    else:
+        rook_from = chess.square(7 if kingside else 0, rank)
+    return move.from_square, king_to, rook_from, rook_to
+
+
+def compile_ply(board, move):
+    """
+    Compiles a single move into primitive board operations and plays it on `board`.
+
+    Args:
+        board (chess.Board): The position before the move; the move is pushed onto it.
+        move (chess.Move): The move to compile.
+
+    Returns:
+        PlyPlan: The compiled ply.
+    """
+    ops = []
+    if board.is_castling(move):
+        king_from, king_to, rook_from, rook_to = castling_squares(board, move)
+        ops += [(SLIDE, square_from, square_to)
+                for square_from, square_to in ((king_from, king_to), (rook_from, rook_to))
+                if square_from != square_to]
+    elif board.is_en_passant(move):
+        captured = move.to_square - 8 if board.turn == chess.WHITE else move.to_square + 8
+        ops += [(FADE, captured), (SLIDE, move.from_square, move.to_square)]
+    else:
+        if board.piece_at(move.to_square) is not None:
+            ops.append((FADE, move.to_square))
+        ops.append((SLIDE, move.from_square, move.to_square))
+        if move.promotion:
+            # The pawn fades out while it slides and the new piece fades in
+            symbol = chess.piece_symbol(move.promotion)
+            ops += [(FADE, move.from_square),
+                    (SPAWN, move.to_square, symbol.upper() if board.turn == chess.WHITE else symbol)]
+
+    board.push(move)
+    if board.is_checkmate():
+        ops.append((BANNER, "Checkmate!"))
+    elif board.is_stalemate():
+        ops.append((BANNER, "Stalemate!"))
+    return PlyPlan(move, tuple(ops))
+
+
+@profiling.timed("compile_moves")
+def compile_moves(moves, start_fen=None, validate=True):
+    """
+    Compiles a whole move list into a plan of primitive board operations.
+
+    python-chess is consulted once per ply here, so playing the plan back needs no chess logic.
+
+    Args:
+        moves (iterable): The moves, as chess.Move objects or UCI strings.
+        start_fen (str, optional): The FEN of the starting position. Defaults to the standard position.
+        validate (bool, optional): If True, raise on illegal moves. Defaults to True.
+
+    Returns:
+        list: One PlyPlan per move.
+
+    Raises:
+        ValueError: If `validate` is True and a move is illegal.
+    """
+    board = chess.Board(start_fen) if start_fen else chess.Board()
+    plan = []
+    for ply, move in enumerate(moves):
+        if isinstance(move, str):
+            move = chess.Move.from_uci(move)
+        if validate:
+            profiling.count("legality_checks")
+            if not board.is_legal(move):
+                raise ValueError(f"Invalid move at ply {ply}: {move}")
+        plan.append(compile_ply(board, move))
+    return plan
+
+
+def batch_plan(plan, plies_per_batch=None, time_budget=None, ply_time=1.5):
+    """
+    Splits a plan into batches of consecutive plies to be played together.
+
+    Args:
+        plan (list): The compiled plies.
+        plies_per_batch (int, optional): The maximum number of plies in a batch.
+        time_budget (float, optional): The maximum playing time of a batch in seconds. A batch
+                                       always holds at least one ply.
+        ply_time (float, optional): The playing time of one ply, used with `time_budget`. Defaults to 1.5.
+
+    Returns:
+        list: The batches, as lists of PlyPlan. Without any limit, the whole plan is one batch.
+    """
+    batches = []
+    for ply in plan:
+        if batches:
+            batch = batches[-1]
+            full = ((plies_per_batch is not None and len(batch) >= plies_per_batch)
+                    or (time_budget is not None and (len(batch) + 1) * ply_time > time_budget))
+            if not full:
+                batch.append(ply)
+                continue
+        batches.append([ply])
+    return batches
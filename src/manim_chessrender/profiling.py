@@ -0,0 +1,172 @@
+from contextlib import contextmanager
+from functools import wraps
+import json
+import time
+
+# The profiler collecting measurements, or None when profiling is off.
+_active = None
+
+
+class Profiler:
+    """
+    Collects counters and timers from the instrumented hot paths while it is active.
+
+    Instrumentation is off unless a profiler is active, in which case every hook costs a
+    single check of the module-level `_active` variable.
+
+    Example:
+        with Profiler("PlayPGNExample", output="profile.json"):
+            PlayPGNExample().render()
+
+    Attributes:
+        name (str): The name of the profile, e.g. the scene name.
+        counters (dict): Event counts by name.
+        timers (dict): [calls, total seconds] by name.
+    """
+
+    def __init__(self, name="profile", output=None):
+        """
+        Initializes an empty profile.
+
+        Args:
+            name (str, optional): The name of the profile. Defaults to "profile".
+            output (str | callable, optional): A JSON file path, or a callable receiving the profile
+                                               as a dictionary, used when the profiler is stopped.
+        """
+        self.name = name
+        self.output = output
+        self.counters = {}
+        self.timers = {}
+        self._previous = None
+        self._start = None
+        self.seconds = 0.0
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, name, seconds):
+        timer = self.timers.setdefault(name, [0, 0.0])
+        timer[0] += 1
+        timer[1] += seconds
+
+    def start(self):
+        """
+        Makes this profiler the active one.
+        """
+        global _active
+        self._previous = _active
+        self._start = time.perf_counter()
+        _active = self
+
+    def stop(self):
+        """
+        Deactivates this profiler, restoring the previously active one, and exports the profile.
+
+        Returns:
+            dict: The profile, see `as_dict`.
+        """
+        global _active
+        self.seconds += time.perf_counter() - self._start
+        _active = self._previous
+        self._previous = None
+        profile = self.as_dict()
+        if callable(self.output):
+            self.output(profile)
+        elif self.output is not None:
+            self.to_json(self.output)
+        return profile
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def as_dict(self):
+        """
+        Returns the profile as a JSON-serializable dictionary.
+
+        Returns:
+            dict: The name, total seconds, counters and timers of the profile.
+        """
+        return {
+            "name": self.name,
+            "seconds": round(self.seconds, 6),
+            "counters": dict(sorted(self.counters.items())),
+            "timers": {name: {"calls": calls, "seconds": round(seconds, 6)}
+                       for name, (calls, seconds) in sorted(self.timers.items())},
+        }
+
+    def to_json(self, path):
+        """
+        Writes the profile to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, "w") as profile_file:
+            json.dump(self.as_dict(), profile_file, indent=2)
+
+
+def active_profiler():
+    """
+    Returns the active profiler.
+
+    Returns:
+        Profiler: The active profiler, or None when profiling is off.
+    """
+    return _active
+
+
+def count(name, amount=1):
+    """
+    Adds to a counter of the active profiler, if any.
+
+    Args:
+        name (str): The counter name.
+        amount (int, optional): The amount to add. Defaults to 1.
+    """
+    if _active is not None:
+        _active.count(name, amount)
+
+
+@contextmanager
+def timer(name):
+    """
+    Times the enclosed block with the active profiler, if any.
+
+    Args:
+        name (str): The timer name.
+    """
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add_time(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """
+    Decorator timing every call of a function with the active profiler, if any.
+
+    Args:
+        name (str): The timer name.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.add_time(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
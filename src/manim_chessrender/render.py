@@ -0,0 +1,467 @@
+from collections import deque, namedtuple
+from multiprocessing.connection import wait
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import traceback
+
+from .cache import cache_dir
+
+# Manim quality presets by their command line flag.
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# A unit of work for run_jobs: calls func(*args), which writes `output`.
+RenderJob = namedtuple("RenderJob", ["name", "func", "args", "output"])
+
+# Bump when the look of the videos changes, so that no cached segment is reused.
+SEGMENT_VERSION = 1
+
+
+def render_scene(scene, output_path, quality="l"):
+    """
+    Renders a scene in a private media directory and moves the movie to `output_path`.
+
+    Args:
+        scene (callable): Creates the Scene to render; called once the config is set.
+        output_path (str): Where to write the movie.
+        quality (str, optional): A key of QUALITIES. Defaults to "l".
+
+    Returns:
+        str: The path of the movie.
+    """
+    from manim import tempconfig
+
+    with tempfile.TemporaryDirectory(prefix="chessrender-") as media_dir:
+        options = {
+            "quality": QUALITIES[quality],
+            "media_dir": media_dir,
+            "disable_caching": True,
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+        }
+        with tempconfig(options):
+            rendered = scene()
+            rendered.render()
+            movie_path = rendered.renderer.file_writer.movie_file_path
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        shutil.move(str(movie_path), output_path)
+    return output_path
+
+
+def render_game(pgn_path, game_id, output_path, quality="l", plies_per_play=None):
+    """
+    Renders one game of a PGN file to its own movie.
+
+    Args:
+        pgn_path (str): The path to the PGN file.
+        game_id (int): The position of the game in the file, starting at 0.
+        output_path (str): Where to write the movie.
+        quality (str, optional): A key of QUALITIES. Defaults to "l".
+        plies_per_play (int, optional): Plies per play call, see `scenes.condensed_playback`.
+                                        Defaults to one play call per ply.
+
+    Returns:
+        str: The path of the movie.
+    """
+    from .pgn import PGNIndex
+    from .scenes import GameScene
+
+    headers, moves = PGNIndex(pgn_path).read_game(game_id)
+    return render_scene(lambda: GameScene(moves, start_fen=headers.get("FEN"), plies_per_play=plies_per_play),
+                        output_path, quality)
+
+
+def split_plies(num_plies, segments):
+    """
+    Splits the plies of a game into contiguous, nearly equal ranges.
+
+    Args:
+        num_plies (int): The number of plies in the game.
+        segments (int): The number of ranges wanted.
+
+    Returns:
+        list: Pairs of (first ply, end ply), with the end excluded.
+    """
+    segments = max(1, min(segments, num_plies))
+    bounds = [round(num_plies * index / segments) for index in range(segments + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def render_segment(moves, start, end, output_path, quality="l", start_fen=None, plies_per_play=None):
+    """
+    Renders plies [start, end) of a game, starting from the position reached at ply `start`.
+
+    The segment begins directly with its first move and only the first segment holds the
+    starting position, so the segments of a game joined with concat_movies are frame for
+    frame the movie GameScene renders in one go.
+
+    Args:
+        moves (list): All moves of the game, as chess.Move objects or UCI strings.
+        start (int): The first ply of the segment.
+        end (int): The ply ending the segment, excluded.
+        output_path (str): Where to write the movie.
+        quality (str, optional): A key of QUALITIES. Defaults to "l".
+        start_fen (str, optional): The FEN of the starting position of the game. Defaults to the standard position.
+        plies_per_play (int, optional): Plies per play call. Defaults to one play call per ply.
+
+    Returns:
+        str: The path of the movie.
+    """
+    from .scenes import GameScene
+
+    intro_wait = 1 if start == 0 else 0
+    return render_scene(lambda: GameScene(moves, start_fen=start_fen, intro_wait=intro_wait,
+                                          start_ply=start, end_ply=end, plies_per_play=plies_per_play),
+                        output_path, quality)
+
+
+def concat_movies(paths, output_path):
+    """
+    Joins movies end to end without re-encoding them.
+
+    The movies must share codec and encoding settings, as the segments rendered by
+    render_segment do.
+
+    Args:
+        paths (list): The movies to join, in order.
+        output_path (str): Where to write the joined movie.
+
+    Returns:
+        str: The path of the joined movie.
+    """
+    import av
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as manifest:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            manifest.write(f"file '{escaped}'\n")
+    try:
+        with av.open(manifest.name, format="concat", options={"safe": "0"}) as movies, \
+                av.open(output_path, mode="w") as output:
+            stream = movies.streams.video[0]
+            if hasattr(output, "add_stream_from_template"):
+                output_stream = output.add_stream_from_template(template=stream)
+            else:
+                output_stream = output.add_stream(template=stream)
+            for packet in movies.demux(stream):
+                # Skip the flushing packets generated by demux
+                if packet.dts is None:
+                    continue
+                # Timestamps restart in every movie; let libav recompute them
+                packet.dts = None
+                packet.stream = output_stream
+                output.mux(packet)
+    finally:
+        os.remove(manifest.name)
+    return output_path
+
+
+def shared_segments(games, min_games=2):
+    """
+    Splits games into ply ranges at the plies where they stop sharing their moves.
+
+    The games are inserted into a move trie. Every game is cut wherever fewer of the other
+    games continue with its next move, as long as at least `min_games` games share its
+    moves so far; the rest of the game, played by fewer games, is kept in one range.
+
+    Args:
+        games (list): (start FEN, moves) pairs, with the moves as chess.Move objects or UCI strings.
+                      A start FEN of None means the standard position.
+        min_games (int, optional): The number of games that must share a range to split it off. Defaults to 2.
+
+    Returns:
+        list: For every game, its (first ply, end ply, shared) ranges, with the end excluded and `shared`
+              telling whether at least `min_games` games play every move of the range.
+    """
+    import chess
+
+    paths = [(start_fen or chess.STARTING_FEN, [str(move) for move in moves]) for start_fen, moves in games]
+    trie = {}
+    for start_fen, moves in paths:
+        node = trie.setdefault(start_fen, [0, {}])
+        node[0] += 1
+        for move in moves:
+            node = node[1].setdefault(move, [0, {}])
+            node[0] += 1
+
+    segments = []
+    for start_fen, moves in paths:
+        # counts[ply]: the number of games playing the first `ply` moves of this game
+        node = trie[start_fen]
+        counts = [node[0]]
+        for move in moves:
+            node = node[1][move]
+            counts.append(node[0])
+        ranges, start = [], 0
+        for ply in range(1, len(moves)):
+            if counts[ply] < min_games:
+                break
+            if counts[ply + 1] < counts[ply]:
+                ranges.append((start, ply, True))
+                start = ply
+        ranges.append((start, len(moves), counts[-1] >= min_games))
+        segments.append(ranges)
+    return segments
+
+
+def segment_key(moves, start, end, start_fen=None, options=None):
+    """
+    Returns the cache key of the movie of plies [start, end) of a game.
+
+    The movie only depends on the moves played up to `end`, so the games sharing those
+    moves share the key.
+
+    Args:
+        moves (list): The moves of the game, as chess.Move objects or UCI strings.
+        start (int): The first ply of the segment.
+        end (int): The ply ending the segment, excluded.
+        start_fen (str, optional): The FEN of the starting position. Defaults to the standard position.
+        options (dict, optional): Everything else the movie depends on, such as the quality.
+
+    Returns:
+        str: The hex digest.
+    """
+    import chess
+
+    content = json.dumps([SEGMENT_VERSION, start_fen or chess.STARTING_FEN, [str(move) for move in moves[:end]],
+                          start, end, sorted((options or {}).items())])
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def render_cached_segment(moves, start, end, output_path, quality="l", start_fen=None, plies_per_play=None):
+    """
+    Renders a segment like render_segment, moving it to `output_path` only once it is complete.
+
+    Returns:
+        str: The path of the movie.
+    """
+    root, extension = os.path.splitext(output_path)
+    temp_path = f"{root}.{os.getpid()}.tmp{extension}"
+    try:
+        render_segment(moves, start, end, temp_path, quality, start_fen, plies_per_play)
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return output_path
+
+
+def render_games_shared(games, quality="l", workers=None, timeout=None, retries=0, plies_per_play=None,
+                        min_games=2, segment_dir=None, on_result=None):
+    """
+    Renders many games, rendering the opening moves they share only once.
+
+    Every game is split by shared_segments. The ranges shared by several games are rendered
+    once into a cache of segments keyed by segment_key, where later batches find them too;
+    the remaining ranges are rendered for their game alone. Each movie is then joined from
+    its segments with concat_movies.
+
+    Args:
+        games (list): (name, start FEN, moves, output path) tuples. A start FEN of None means the standard position.
+        quality (str, optional): A key of QUALITIES. Defaults to "l".
+        workers (int, optional): The number of segments rendered at once. Defaults to the number of CPUs.
+        timeout (float, optional): Seconds allowed per segment render attempt.
+        retries (int, optional): How many times a failed segment is retried. Defaults to 0.
+        plies_per_play (int, optional): Plies per play call. Defaults to one play call per ply.
+        min_games (int, optional): The number of games that must share a range for it to be cached. Defaults to 2.
+        segment_dir (str, optional): The directory of the cached segments. Defaults to cache_dir("segments").
+        on_result (callable, optional): Called with each result as soon as its movie is joined.
+
+    Returns:
+        list: One result dictionary per game, shaped like the results of run_jobs, with the number of
+              "segments" of the movie and how many of them were "cached" before this call.
+    """
+    segment_dir = segment_dir or cache_dir("segments")
+    os.makedirs(segment_dir, exist_ok=True)
+    options = {"quality": quality, "plies_per_play": plies_per_play}
+    ranges = shared_segments([(start_fen, moves) for _, start_fen, moves, _ in games], min_games)
+
+    with tempfile.TemporaryDirectory(prefix="chessrender-segments-") as tail_dir:
+        jobs, job_index, game_segments = [], {}, []
+        for (name, start_fen, moves, _), game_ranges in zip(games, ranges):
+            paths, cached = [], 0
+            for start, end, shared in game_ranges:
+                if shared:
+                    path = os.path.join(segment_dir, segment_key(moves, start, end, start_fen, options) + ".mp4")
+                    if os.path.exists(path):
+                        cached += 1
+                    elif path not in job_index:
+                        job_index[path] = len(jobs)
+                        jobs.append(RenderJob(f"{name} plies {start}-{end}", render_cached_segment,
+                                              (moves, start, end, path, quality, start_fen, plies_per_play), path))
+                else:
+                    path = os.path.join(tail_dir, f"{len(jobs):06d}.mp4")
+                    job_index[path] = len(jobs)
+                    jobs.append(RenderJob(f"{name} plies {start}-{end}", render_segment,
+                                          (moves, start, end, path, quality, start_fen, plies_per_play), path))
+                paths.append(path)
+            game_segments.append((paths, cached))
+
+        segment_results = run_jobs(jobs, workers=workers, timeout=timeout, retries=retries)
+
+        results = []
+        for (name, _, _, output_path), (paths, cached) in zip(games, game_segments):
+            own = [segment_results[job_index[path]] for path in paths if path in job_index]
+            start = time.monotonic()
+            error = next((result["error"] for result in own if result["status"] != "ok"), None)
+            if error is None:
+                try:
+                    concat_movies(paths, output_path)
+                except Exception:
+                    error = traceback.format_exc()
+            results.append({
+                "name": name,
+                "status": "ok" if error is None else "failed",
+                "attempts": max((result["attempts"] for result in own), default=1),
+                "seconds": round(sum(result["seconds"] for result in own) + time.monotonic() - start, 3),
+                "output": output_path,
+                "error": error,
+                "segments": len(paths),
+                "cached": cached,
+            })
+            if on_result is not None:
+                on_result(results[-1])
+    return results
+
+
+def render_game_split(pgn_path, game_id, output_path, quality="l", segments=None, workers=None,
+                      timeout=None, retries=0, plies_per_play=None):
+    """
+    Renders one long game by splitting its mainline into ply ranges rendered in parallel,
+    then joining the segments losslessly.
+
+    Args:
+        pgn_path (str): The path to the PGN file.
+        game_id (int): The position of the game in the file, starting at 0.
+        output_path (str): Where to write the movie.
+        quality (str, optional): A key of QUALITIES. Defaults to "l".
+        segments (int, optional): The number of ply ranges. Defaults to the number of workers.
+        workers (int, optional): The number of segments rendered at once. Defaults to the number of CPUs.
+        timeout (float, optional): Seconds allowed per segment render attempt.
+        retries (int, optional): How many times a failed segment is retried. Defaults to 0.
+        plies_per_play (int, optional): Plies per play call. Defaults to one play call per ply.
+
+    Returns:
+        str: The path of the movie.
+
+    Raises:
+        RuntimeError: If a segment could not be rendered.
+    """
+    from .pgn import PGNIndex
+
+    headers, moves = PGNIndex(pgn_path).read_game(game_id)
+    start_fen = headers.get("FEN")
+    workers = workers or os.cpu_count() or 1
+    ranges = split_plies(len(moves), segments or workers) if moves else [(0, 0)]
+
+    with tempfile.TemporaryDirectory(prefix="chessrender-segments-") as segment_dir:
+        jobs = []
+        for number, (start, end) in enumerate(ranges):
+            path = os.path.join(segment_dir, f"segment-{number:04d}.mp4")
+            jobs.append(RenderJob(f"plies {start}-{end}", render_segment,
+                                  (moves, start, end, path, quality, start_fen, plies_per_play), path))
+        results = run_jobs(jobs, workers=workers, timeout=timeout, retries=retries)
+        failed = [result for result in results if result["status"] != "ok"]
+        if failed:
+            raise RuntimeError(f"Segment {failed[0]['name']} failed:\n{failed[0]['error']}")
+        return concat_movies([job.output for job in jobs], output_path)
+
+
+def _run_job(job, connection):
+    try:
+        job.func(*job.args)
+    except BaseException:
+        connection.send(traceback.format_exc())
+    else:
+        connection.send(None)
+    finally:
+        connection.close()
+
+
+def run_jobs(jobs, workers=None, timeout=None, retries=0, on_result=None):
+    """
+    Runs jobs in a pool of worker processes.
+
+    Every attempt runs in a fresh process, so a job that exceeds its timeout can be
+    terminated without affecting the others. Failed or timed out jobs are retried.
+
+    Args:
+        jobs (list): The RenderJob objects to run.
+        workers (int, optional): The number of jobs running at once. Defaults to the number of CPUs.
+        timeout (float, optional): Seconds after which an attempt is terminated. Defaults to no timeout.
+        retries (int, optional): How many times a failed job is retried. Defaults to 0.
+        on_result (callable, optional): Called with each result as soon as its job finishes.
+
+    Returns:
+        list: One result dictionary per job, in the order of `jobs`, with the keys
+              "name", "status" ("ok" or "failed"), "attempts", "seconds", "output" and "error".
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = deque((index, 1) for index in range(len(jobs)))
+    running = {}
+    results = [None] * len(jobs)
+
+    while pending or running:
+        while pending and len(running) < workers:
+            index, attempt = pending.popleft()
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=_run_job, args=(jobs[index], sender), daemon=True)
+            process.start()
+            sender.close()
+            running[process] = {"index": index, "attempt": attempt, "start": time.monotonic(),
+                                "receiver": receiver, "error": None, "reported": False}
+
+        wait([process.sentinel for process in running] +
+             [state["receiver"] for state in running.values() if not state["reported"]], timeout=0.5)
+
+        now = time.monotonic()
+        for process, state in list(running.items()):
+            receiver = state["receiver"]
+            if not state["reported"] and receiver.poll():
+                try:
+                    state["error"] = receiver.recv()
+                except EOFError:
+                    state["error"] = "Worker exited without reporting a result"
+                state["reported"] = True
+
+            if process.is_alive():
+                if timeout is None or now - state["start"] < timeout:
+                    continue
+                process.terminate()
+                process.join()
+                state["error"] = f"Timed out after {timeout:g}s"
+            else:
+                process.join()
+                if not state["reported"] and receiver.poll():
+                    state["error"] = receiver.recv()
+                elif not state["reported"]:
+                    state["error"] = f"Worker exited with code {process.exitcode}"
+            receiver.close()
+            del running[process]
+
+            index, attempt = state["index"], state["attempt"]
+            if state["error"] is not None and attempt <= retries:
+                pending.append((index, attempt + 1))
+                continue
+            results[index] = {
+                "name": jobs[index].name,
+                "status": "ok" if state["error"] is None else "failed",
+                "attempts": attempt,
+                "seconds": round(now - state["start"], 3),
+                "output": jobs[index].output,
+                "error": state["error"],
+            }
+            if on_result is not None:
+                on_result(results[index])
+    return results
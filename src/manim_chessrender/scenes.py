@@ -0,0 +1,314 @@
+from manim import FadeOut, MovingCameraScene, Succession, Wait
+import chess
+import numpy as np
+from .feed import GameFeed
+from .frame_cache import FrameCache
+from .mobjects.board_grid import ChessBoardGrid
+from .mobjects.chessboard import ChessBoard
+from .plan import batch_plan
+from .profiling import Profiler
+
+
+def condensed_playback(chessboard, plan, plies_per_play=None, time_budget=None, move_time=1, ply_wait=0.5):
+    """
+    Turns a plan into a few composite animations, each playing several plies in sequence.
+
+    Every ply animates for `move_time` seconds and then holds for `ply_wait` seconds, as when
+    each ply is played and waited on separately, but each batch is a single `Scene.play` call
+    and so a single partial movie file.
+
+    Example:
+        for animation in condensed_playback(chessboard, compile_moves(moves), plies_per_play=20):
+            self.play(animation)
+
+    Args:
+        chessboard (ChessBoard): The board the plan is played on.
+        plan (list): The compiled plies.
+        plies_per_play (int, optional): The maximum number of plies per animation.
+        time_budget (float, optional): The maximum duration of an animation in seconds.
+        move_time (float, optional): Seconds each ply is animated for. Defaults to 1.
+        ply_wait (float, optional): Seconds to hold the position after every ply. Defaults to 0.5.
+
+    Yields:
+        Succession: The animation of a batch of plies. The board is updated as each one is created,
+                    so play each animation before asking for the next.
+    """
+    for batch in batch_plan(plan, plies_per_play, time_budget, move_time + ply_wait):
+        animations = []
+        for ply in batch:
+            ply_animation = chessboard.apply_ply(ply)
+            ply_animation.run_time = move_time
+            animations.append(ply_animation)
+            if ply_wait:
+                animations.append(Wait(ply_wait))
+        yield Succession(*animations, group=chessboard.board)
+
+
+def frame_key(scene, chessboard):
+    """
+    Returns the frame cache key of the current position of a board as shown by a scene.
+
+    Args:
+        scene (Scene): The scene showing the board.
+        chessboard (ChessBoard): The board.
+
+    Returns:
+        str: The key, combining the position, the board theme and layout, the camera frame and the resolution.
+    """
+    camera = scene.renderer.camera
+    return FrameCache.key(chessboard.chessboard, chessboard.template_key(), chessboard.flipped,
+                          tuple(np.round(chessboard.square_centers[0, 0], 4)), round(chessboard.square_size, 4),
+                          tuple(np.round(camera.frame_center, 4)), round(camera.frame_width, 4),
+                          camera.pixel_width, camera.pixel_height, str(camera.background_color))
+
+
+def hold(scene, chessboard, duration, cache):
+    """
+    Holds the current position for `duration` seconds, reusing the frame of an earlier hold of the same position.
+
+    The frame is looked up in the cache by `frame_key`; the scene must show nothing but the
+    board. On a hit the wait is written from the cached frame without rasterizing any mobject,
+    on a miss the wait is rendered as usual and its frame is stored. Renderers other than the
+    Cairo renderer always wait as usual.
+
+    Args:
+        scene (Scene): The scene showing the board.
+        chessboard (ChessBoard): The board, whose pieces match `chessboard.chessboard`.
+        duration (float): Seconds to hold the position.
+        cache (FrameCache): The frame cache.
+    """
+    renderer = scene.renderer
+    if duration <= 0:
+        return
+    if not hasattr(renderer, "save_static_frame_data"):
+        scene.wait(duration)
+        return
+
+    key = frame_key(scene, chessboard)
+    frame = cache.get(key)
+    if frame is None or frame.shape != renderer.camera.pixel_array.shape:
+        scene.wait(duration, frozen_frame=True)
+        if not renderer.skip_animations:
+            cache.put(key, renderer.get_frame())
+        return
+
+    # Let the renderer write the wait as usual, but take its frame from the cache
+    renderer.save_static_frame_data = lambda *args, **kwargs: None
+    renderer.update_frame = lambda *args, **kwargs: renderer.camera.set_pixel_array(frame)
+    try:
+        scene.wait(duration, frozen_frame=True)
+    finally:
+        del renderer.save_static_frame_data, renderer.update_frame
+
+
+class GameScene(MovingCameraScene):
+    """
+    Scene playing the moves of a single game on a chessboard.
+
+    The whole move list is compiled into a plan once, so playing it back involves no chess logic.
+
+    Attributes:
+        moves (list): The moves to play, as chess.Move objects or UCI strings.
+        start_fen (str): The FEN of the starting position, or None for the standard position.
+        intro_wait (float): Seconds to hold the starting position before the first move.
+        ply_wait (float): Seconds to hold the position after every move.
+        start_ply (int): The ply the scene starts from; earlier moves are applied without animation.
+        end_ply (int): The ply the scene stops at, or None to play the game to the end.
+        plies_per_play (int): The number of plies played per `play` call in condensed playback, or None.
+        play_budget (float): The maximum duration of a `play` call in condensed playback, or None.
+        profile (str | callable): Where the profile of the render goes, see `profiling.Profiler`, or None.
+        frame_cache (FrameCache): The cache serving the frames of held positions, or None.
+    """
+
+    def __init__(self, moves, start_fen=None, intro_wait=1, ply_wait=0.5, start_ply=0, end_ply=None,
+                 plies_per_play=None, play_budget=None, profile=None, frame_cache=None, **kwargs):
+        """
+        Initializes the scene with the moves of a game.
+
+        Args:
+            moves (list): The moves to play, as chess.Move objects or UCI strings.
+            start_fen (str, optional): The FEN of the starting position. Defaults to the standard position.
+            intro_wait (float, optional): Seconds to hold the starting position. Defaults to 1.
+            ply_wait (float, optional): Seconds to hold the position after every move. Defaults to 0.5.
+            start_ply (int, optional): The ply to start from, e.g. 60 to begin after move 30. Defaults to 0.
+            end_ply (int, optional): The ply to stop at, excluded. Defaults to the end of the game.
+            plies_per_play (int, optional): Play this many plies per `play` call, see `condensed_playback`.
+                                            Defaults to one play and one wait per ply.
+            play_budget (float, optional): Play as many plies per `play` call as fit in this many seconds.
+            profile (str | callable, optional): Profile the render and write the profile to this JSON file,
+                                                or pass it as a dictionary to this callable. Defaults to no profiling.
+            frame_cache (FrameCache, optional): Serve the holds of positions seen before from this cache,
+                                                see `hold`. Defaults to rendering every hold.
+            **kwargs: Additional keyword arguments passed to the MovingCameraScene superclass.
+        """
+        self.moves = [str(move) for move in moves]
+        self.start_fen = start_fen
+        self.intro_wait = intro_wait
+        self.ply_wait = ply_wait
+        self.start_ply = start_ply
+        self.end_ply = end_ply
+        self.plies_per_play = plies_per_play
+        self.play_budget = play_budget
+        self.profile = profile
+        self.frame_cache = frame_cache
+        super().__init__(**kwargs)
+
+    def render(self, *args, **kwargs):
+        if self.profile is None:
+            return super().render(*args, **kwargs)
+        with Profiler(type(self).__name__, output=self.profile):
+            return super().render(*args, **kwargs)
+
+    def setup_board(self):
+        """
+        Creates the chessboard in the position reached at `start_ply`.
+
+        Returns:
+            ChessBoard: The chessboard.
+        """
+        chessboard = ChessBoard()
+        chessboard.load_game(self.moves, self.start_fen, ply=self.start_ply)
+        return chessboard
+
+    def construct(self):
+        chessboard = self.setup_board()
+        self.add(chessboard.board)
+        if self.intro_wait:
+            self.hold_position(chessboard, self.intro_wait)
+
+        plan = chessboard.game_plan[self.start_ply:self.end_ply]
+        if self.plies_per_play or self.play_budget:
+            for animation in condensed_playback(chessboard, plan, self.plies_per_play, self.play_budget,
+                                                ply_wait=self.ply_wait):
+                self.play(animation)
+            return
+
+        for ply in plan:
+            self.play(chessboard.apply_ply(ply))
+            self.hold_position(chessboard, self.ply_wait)
+
+    def hold_position(self, chessboard, duration):
+        """
+        Holds the current position, from the frame cache if the scene has one.
+
+        Args:
+            chessboard (ChessBoard): The board.
+            duration (float): Seconds to hold the position.
+        """
+        if self.frame_cache is None:
+            self.wait(duration)
+        else:
+            hold(self, chessboard, duration, self.frame_cache)
+
+
+class GridScene(MovingCameraScene):
+    """
+    Scene playing several games at once on a grid of chessboards, one ply of every game per step.
+
+    Attributes:
+        games (list): The games, as move lists or (headers, moves) pairs, or None.
+        pgn_sources (list): PGN paths or (path, game id) pairs to read the games from, or None.
+        columns (int): The number of boards per row, or None for a roughly square grid.
+        intro_wait (float): Seconds to hold the starting positions before the first step.
+        ply_wait (float): Seconds to hold the positions after every step.
+    """
+
+    def __init__(self, games=None, pgn_sources=None, columns=None, intro_wait=1, ply_wait=0.5, **kwargs):
+        """
+        Initializes the scene with the games to play, given either directly or as PGN sources.
+
+        Args:
+            games (list, optional): Move lists or (headers, moves) pairs as yielded by `iter_games`.
+            pgn_sources (list, optional): PGN paths, meaning their first game, or (path, game id) pairs.
+            columns (int, optional): The number of boards per row. Defaults to a roughly square grid.
+            intro_wait (float, optional): Seconds to hold the starting positions. Defaults to 1.
+            ply_wait (float, optional): Seconds to hold the positions after every step. Defaults to 0.5.
+            **kwargs: Additional keyword arguments passed to the MovingCameraScene superclass.
+        """
+        self.games = list(games) if games is not None else None
+        self.pgn_sources = list(pgn_sources) if pgn_sources is not None else None
+        self.columns = columns
+        self.intro_wait = intro_wait
+        self.ply_wait = ply_wait
+        super().__init__(**kwargs)
+
+    def construct(self):
+        if self.games is not None:
+            grid = ChessBoardGrid(len(self.games), columns=self.columns)
+            grid.load_games(self.games)
+        else:
+            grid = ChessBoardGrid(len(self.pgn_sources), columns=self.columns)
+            grid.load_pgns(self.pgn_sources)
+        self.add(grid)
+        if self.intro_wait:
+            self.wait(self.intro_wait)
+
+        for animation in grid.steps():
+            self.play(animation)
+            self.wait(self.ply_wait)
+
+
+class PGNFeedScene(MovingCameraScene):
+    """
+    Scene playing the games of a PGN file one after another on a single chessboard.
+
+    The games are read and compiled by a GameFeed in a background thread while the scene
+    animates, so the first move is played as soon as the first game is read instead of
+    after the whole file has been parsed.
+
+    Attributes:
+        source (str): The path to the PGN file.
+        where (callable | dict): A header filter, see `pgn.header_matcher`, or None.
+        skip (int): The number of matching games skipped.
+        limit (int): The maximum number of games played, or None.
+        queue_size (int): The maximum number of games read ahead of the scene.
+        intro_wait (float): Seconds to hold the starting position of every game.
+        ply_wait (float): Seconds to hold the position after every move.
+    """
+
+    def __init__(self, source, where=None, skip=0, limit=None, queue_size=4, intro_wait=1, ply_wait=0.5, **kwargs):
+        """
+        Initializes the scene with the games to read.
+
+        Args:
+            source (str): The path to the PGN file.
+            where (callable | dict, optional): Only play the games whose headers match, see `pgn.header_matcher`.
+            skip (int, optional): The number of matching games to skip. Defaults to 0.
+            limit (int, optional): The maximum number of games to play. Defaults to all games.
+            queue_size (int, optional): The maximum number of games read ahead of the scene. Defaults to 4.
+            intro_wait (float, optional): Seconds to hold the starting position of every game. Defaults to 1.
+            ply_wait (float, optional): Seconds to hold the position after every move. Defaults to 0.5.
+            **kwargs: Additional keyword arguments passed to the MovingCameraScene superclass.
+        """
+        self.source = source
+        self.where = where
+        self.skip = skip
+        self.limit = limit
+        self.queue_size = queue_size
+        self.intro_wait = intro_wait
+        self.ply_wait = ply_wait
+        super().__init__(**kwargs)
+
+    def construct(self):
+        chessboard = ChessBoard()
+        with GameFeed(self.source, self.where, self.skip, self.limit, maxsize=self.queue_size) as feed:
+            for number, game in enumerate(feed):
+                start_fen = game.headers.get("FEN", chess.STARTING_FEN)
+                if number == 0:
+                    chessboard.load_fen(start_fen, incremental=True)
+                    self.add(chessboard.board)
+                else:
+                    # Clear the banner ending the previous game, if any, while setting up the next one
+                    transition = chessboard.load_fen(start_fen, incremental=True, animate=True)
+                    animations = [transition] if transition.animations else []
+                    if chessboard.banner is not None:
+                        animations.append(FadeOut(chessboard.banner))
+                        chessboard.banner = None
+                    if animations:
+                        self.play(*animations)
+                if self.intro_wait:
+                    self.wait(self.intro_wait)
+
+                for ply in game.plan:
+                    self.play(chessboard.apply_ply(ply))
+                    self.wait(self.ply_wait)
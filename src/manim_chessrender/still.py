@@ -0,0 +1,231 @@
+from PIL import Image, ImageDraw, ImageFont
+import chess
+import os
+
+module_dir = os.path.dirname(__file__)
+data_dir = os.path.join(module_dir, 'images')
+
+# The look of a default ChessBoard: WHITE and GREEN squares filled at 0.7 opacity over
+# the black scene background, black lines, and labels in the opposite square color.
+SQUARE_COLORS = ("#FFFFFF", "#83C167")
+LINE_COLOR = "#000000"
+BACKGROUND_COLOR = "#000000"
+SQUARE_OPACITY = 0.7
+# Fractions of a square: the size of the piece images as laid out by ChessPiece, the line
+# width, the offset of the labels from the square center and the height of the labels.
+PIECE_SIZE = 0.948
+LINE_WIDTH = 0.04
+LABEL_OFFSET = 0.35
+LABEL_SIZE = 0.2
+LABEL_FONTS = ("UbuntuMono-R.ttf", "DejaVuSansMono.ttf", "LiberationMono-Regular.ttf")
+
+PIECE_NAMES = {"p": "pawn", "n": "knight", "b": "bishop", "r": "rook", "q": "queen", "k": "king"}
+
+# Scaled piece images shared by all renderers, keyed by (piece directory, symbol, square size).
+_piece_images = {}
+
+
+def hex_to_rgb(color):
+    color = str(color).lstrip("#")
+    return tuple(int(color[index:index + 2], 16) for index in (0, 2, 4))
+
+
+def parse_placement(placement):
+    """
+    Reads the piece placement field of a FEN.
+
+    Args:
+        placement (str): The piece placement field, e.g. "8/8/8/8/8/8/8/4K2k".
+
+    Yields:
+        tuple: The square index (0-63) and FEN symbol of every piece.
+
+    Raises:
+        ValueError: If the placement is malformed.
+    """
+    rank, file = 7, 0
+    for char in placement:
+        if char == "/":
+            rank, file = rank - 1, 0
+        elif char.isdigit():
+            file += int(char)
+        elif char.lower() in PIECE_NAMES and file < 8 and rank >= 0:
+            yield rank * 8 + file, char
+            file += 1
+        else:
+            raise ValueError(f"Invalid piece placement: {placement!r}")
+
+
+def load_label_font(size, fonts=LABEL_FONTS):
+    """
+    Loads the first available label font.
+
+    Args:
+        size (int): The font size in pixels.
+        fonts (tuple, optional): The font files to try, in order.
+
+    Returns:
+        ImageFont: The font, or Pillow's default font if none of the fonts is installed.
+    """
+    for font in fonts:
+        try:
+            return ImageFont.truetype(font, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+class StillRenderer:
+    """
+    Draws positions straight into images with the look of a ChessBoard, without manim.
+
+    The board background, with its squares, lines and labels, is drawn once, and every
+    piece image is scaled once; a position is then drawn by pasting its pieces onto a
+    copy of the background.
+
+    Example:
+        renderer = StillRenderer(size=320)
+        renderer.save("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3", "diagram.png")
+
+    Attributes:
+        square_size (int): The side length of a square in pixels.
+        size (int): The side length of the image in pixels, 8 times `square_size`.
+        flipped (bool): Whether the board is seen from Black's side.
+    """
+
+    def __init__(self, size=480, square_colors=SQUARE_COLORS, line_color=LINE_COLOR,
+                 background_color=BACKGROUND_COLOR, labels=True, flipped=False, piece_dir=data_dir):
+        """
+        Initializes the renderer and prebuilds the board background.
+
+        Args:
+            size (int, optional): The side length of the image in pixels, rounded down to a multiple of 8.
+                                  Defaults to 480.
+            square_colors (tuple, optional): The two square colors as hex strings. Defaults to those of ChessBoard.
+            line_color (str, optional): The line color as a hex string. Defaults to black.
+            background_color (str, optional): The color the squares are blended over. Defaults to black.
+            labels (bool, optional): Whether to draw the rank and file labels. Defaults to True.
+            flipped (bool, optional): Whether to show the board from Black's side. Defaults to False.
+            piece_dir (str, optional): The directory of the piece images, named like "white-king.ico".
+                                       Defaults to the images of ChessPiece.
+        """
+        self.square_size = max(1, size // 8)
+        self.size = 8 * self.square_size
+        self.square_colors = square_colors
+        self.line_color = line_color
+        self.background_color = background_color
+        self.labels = labels
+        self.flipped = flipped
+        self.piece_dir = piece_dir
+        self.background = self.build_background()
+
+    def square_origin(self, square):
+        """
+        Returns the pixel coordinates of the top left corner of a square.
+
+        Args:
+            square (int): The square index (0-63).
+
+        Returns:
+            tuple: The x and y coordinates.
+        """
+        file, rank = chess.square_file(square), chess.square_rank(square)
+        if self.flipped:
+            file, rank = 7 - file, 7 - rank
+        return file * self.square_size, (7 - rank) * self.square_size
+
+    def build_background(self):
+        """
+        Draws the empty board with its squares, lines and labels.
+
+        Returns:
+            PIL.Image.Image: The RGB background.
+        """
+        background = hex_to_rgb(self.background_color)
+        light, dark = [tuple(round(SQUARE_OPACITY * channel + (1 - SQUARE_OPACITY) * base)
+                             for channel, base in zip(hex_to_rgb(color), background))
+                       for color in self.square_colors]
+        image = Image.new("RGB", (self.size, self.size), background)
+        draw = ImageDraw.Draw(image)
+        line_width = max(1, round(LINE_WIDTH * self.square_size))
+        for square in chess.SQUARES:
+            x, y = self.square_origin(square)
+            dark_square = (chess.square_file(square) + chess.square_rank(square)) % 2 == 0
+            draw.rectangle((x, y, x + self.square_size - 1, y + self.square_size - 1),
+                           fill=dark if dark_square else light, outline=self.line_color, width=line_width)
+
+        if self.labels:
+            font = load_label_font(max(6, round(LABEL_SIZE * self.square_size)))
+            edge_rank = 7 if self.flipped else 0
+            edge_file = 7 if self.flipped else 0
+            offset = LABEL_OFFSET * self.square_size
+            for file in range(8):
+                self.draw_label(draw, font, chess.FILE_NAMES[file], chess.square(file, edge_rank), offset, offset)
+            for rank in range(8):
+                self.draw_label(draw, font, chess.RANK_NAMES[rank], chess.square(edge_file, rank), -offset, -offset)
+        return image
+
+    def draw_label(self, draw, font, text, square, dx, dy):
+        x, y = self.square_origin(square)
+        dark_square = (chess.square_file(square) + chess.square_rank(square)) % 2 == 0
+        color = self.square_colors[0] if dark_square else self.square_colors[1]
+        center = (x + self.square_size / 2 + dx, y + self.square_size / 2 + dy)
+        draw.text(center, text, fill=color, font=font, anchor="mm")
+
+    def piece_image(self, symbol):
+        """
+        Returns the image of a piece scaled to the board, scaling it on first use.
+
+        Args:
+            symbol (str): The FEN symbol of the piece, uppercase for white.
+
+        Returns:
+            tuple: The RGBA image and the offset at which it is centered on a square.
+        """
+        key = (self.piece_dir, symbol, self.square_size)
+        piece = _piece_images.get(key)
+        if piece is None:
+            color = "white" if symbol.isupper() else "black"
+            with Image.open(os.path.join(self.piece_dir, f"{color}-{PIECE_NAMES[symbol.lower()]}.ico")) as source:
+                source = source.convert("RGBA")
+            height = max(1, round(PIECE_SIZE * self.square_size))
+            width = max(1, round(source.width * height / source.height))
+            image = source.resize((width, height), Image.LANCZOS)
+            piece = _piece_images[key] = (image, ((self.square_size - width) // 2, (self.square_size - height) // 2))
+        return piece
+
+    def render(self, fen):
+        """
+        Draws a position.
+
+        Args:
+            fen (str): The FEN string, or just its piece placement field.
+
+        Returns:
+            PIL.Image.Image: The RGB image of the position.
+
+        Raises:
+            ValueError: If the FEN is malformed.
+        """
+        image = self.background.copy()
+        for square, symbol in parse_placement(fen.split()[0]):
+            piece_image, (dx, dy) = self.piece_image(symbol)
+            x, y = self.square_origin(square)
+            # The background is opaque, so pasting through the alpha channel composites the piece
+            image.paste(piece_image, (x + dx, y + dy), piece_image)
+        return image
+
+    def save(self, fen, path, format=None):
+        """
+        Draws a position and writes it to an image file.
+
+        Args:
+            fen (str): The FEN string, or just its piece placement field.
+            path (str): Where to write the image.
+            format (str, optional): The image format. Defaults to the format of the file extension.
+
+        Returns:
+            str: The path of the image.
+        """
+        self.render(fen).save(path, format=format)
+        return path
@@ -0,0 +1,113 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import pytest
+from manim_chessrender.mobjects.chess_cli import ManimChessCLI, parse_selection
+from manim_chessrender.render import RenderJob, run_jobs, segment_key, shared_segments, split_plies
+
+EXAMPLE_PGN = os.path.join(os.path.dirname(__file__), '..', 'example', 'example.pgn')
+SOURCE_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+
+def succeed():
+    pass
+
+
+def fail():
+    raise RuntimeError("render failed")
+
+
+def hang():
+    time.sleep(10)
+
+
+def test_parse_selection():
+    assert parse_selection("0,3,5-7") == {0, 3, 5, 6, 7}, "Incorrect game selection."
+    with pytest.raises(ValueError):
+        parse_selection("a-b")
+
+
+def test_select_games(tmp_path):
+    pgn_path = tmp_path / "example.pgn"
+    shutil.copy(EXAMPLE_PGN, pgn_path)
+    cli = ManimChessCLI()
+    args = cli.parser.parse_args(["render", str(pgn_path), "-g", "0-3", "--where", "White=Paulsen, Louis",
+                                  "-o", str(tmp_path)])
+    jobs = cli.select_games(args)
+    assert [job.name for job in jobs] == ["example-00001"], "Incorrect games selected."
+    args = cli.parser.parse_args(["render", str(pgn_path), "--where", "Site=London", "-o", str(tmp_path)])
+    assert len(cli.select_games(args)) == 54, "Tags outside the index should be matched too."
+
+
+def test_run_jobs_retries_and_timeouts():
+    jobs = [RenderJob("ok", succeed, (), None), RenderJob("error", fail, (), None),
+            RenderJob("hang", hang, (), None)]
+    ok, error, hung = run_jobs(jobs, workers=3, timeout=1, retries=1)
+    assert ok["status"] == "ok" and ok["attempts"] == 1
+    assert error["status"] == "failed" and error["attempts"] == 2, "Failed jobs should be retried."
+    assert "render failed" in error["error"], "Worker errors should be reported."
+    assert hung["status"] == "failed" and "Timed out" in hung["error"], "Jobs should time out."
+
+
+def test_split_plies():
+    assert split_plies(10, 3) == [(0, 3), (3, 7), (7, 10)], "Incorrect ply ranges."
+    assert split_plies(2, 4) == [(0, 1), (1, 2)], "Ranges should not be empty."
+
+
+def test_shared_segments():
+    games = [(None, ["e2e4", "e7e5", "g1f3", "b8c6"]),
+             (None, ["e2e4", "e7e5", "g1f3", "g8f6"]),
+             (None, ["e2e4", "c7c5"]),
+             ("4k3/8/8/8/8/8/8/4K3 w - - 0 1", ["e1e2"])]
+    assert shared_segments(games) == [
+        [(0, 1, True), (1, 3, True), (3, 4, False)],
+        [(0, 1, True), (1, 3, True), (3, 4, False)],
+        [(0, 1, True), (1, 2, False)],
+        [(0, 1, False)],
+    ], "Games should be split where they stop sharing moves."
+    assert segment_key(games[0][1], 1, 3) == segment_key(games[1][1], 1, 3), "Shared moves should share a segment."
+    assert segment_key(games[0][1], 0, 1) != segment_key(games[0][1], 0, 1, options={"quality": "h"})
+
+
+def test_export_skips_unchanged_diagrams(tmp_path, capsys):
+    epd = tmp_path / "puzzles.epd"
+    epd.write_text('4k3/8/8/8/8/8/8/4K3 w - - id "bare kings";\n'
+                   'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1\n')
+    output = tmp_path / "diagrams"
+    argv = ["export", str(epd), "-o", str(output), "-j", "2", "--size", "80"]
+    assert ManimChessCLI().run(argv) == 0
+    assert sorted(path.name for path in output.iterdir()) == ["bare_kings.png", "manifest.json", "puzzles-000002.png"]
+    assert ManimChessCLI().run(argv) == 0
+    assert "Drew 0 diagrams, skipped 2 unchanged" in capsys.readouterr().out, "Unchanged diagrams should be skipped."
+    assert ManimChessCLI().run(argv + ["--flipped"]) == 0
+    assert "Drew 2 diagrams" in capsys.readouterr().out, "Changed options should redraw the diagrams."
+
+
+def test_export_keeps_earlier_diagrams_in_manifest(tmp_path, capsys):
+    output = tmp_path / "diagrams"
+    first, second = tmp_path / "first.epd", tmp_path / "second.epd"
+    first.write_text('4k3/8/8/8/8/8/8/4K3 w - - id "bare kings";\n')
+    second.write_text('4k3/8/8/8/8/8/8/3QK3 w - - id "queen";\n')
+    assert ManimChessCLI().run(["export", str(first), "-o", str(output), "--size", "80"]) == 0
+    assert ManimChessCLI().run(["export", str(second), "-o", str(output), "--size", "80"]) == 0
+    with open(output / "manifest.json") as manifest_file:
+        assert sorted(json.load(manifest_file)["diagrams"]) == ["bare_kings", "queen"], \
+            "Diagrams of earlier runs should stay in the manifest."
+    os.remove(output / "bare_kings.png")
+    assert ManimChessCLI().run(["export", str(second), "-o", str(output), "--size", "80"]) == 0
+    with open(output / "manifest.json") as manifest_file:
+        assert sorted(json.load(manifest_file)["diagrams"]) == ["queen"], "Deleted diagrams should leave the manifest."
+    assert "Drew 0 diagrams, skipped 1 unchanged" in capsys.readouterr().out.splitlines()[-1]
+
+
+def test_cli_does_not_import_manim():
+    code = ("import sys, manim_chessrender\n"
+            "from manim_chessrender.mobjects.chess_cli import ManimChessCLI\n"
+            "manim_chessrender.PGNIndex, manim_chessrender.position_to_index\n"
+            "print('manim' in sys.modules)")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SOURCE_DIR, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False", "Importing the package and the CLI should not import manim."
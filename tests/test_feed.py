@@ -0,0 +1,39 @@
+import io
+import os
+import time
+import chess
+import pytest
+from manim_chessrender.feed import GameFeed
+from manim_chessrender.pgn import iter_games
+from manim_chessrender.plan import compile_moves
+
+EXAMPLE_PGN = os.path.join(os.path.dirname(__file__), '..', 'example', 'example.pgn')
+
+
+def test_game_feed_matches_iter_games():
+    with GameFeed(EXAMPLE_PGN, maxsize=1) as feed:
+        time.sleep(0.2)
+        assert feed.queue.qsize() <= 1, "The reader should not run ahead of the queue size."
+        games = list(feed)
+    expected = list(iter_games(EXAMPLE_PGN))
+    assert [moves for _, moves, _ in games] == [moves for _, moves in expected], "Feed should read every game."
+    assert games[0].plan == compile_moves(expected[0][1]), "Feed should compile every game."
+
+
+def test_game_feed_passes_errors_to_consumer():
+    with pytest.raises(FileNotFoundError):
+        with GameFeed("missing.pgn") as feed:
+            list(feed)
+
+    feed = GameFeed(io.StringIO('[FEN "not a fen"]\n\n1. e4 *\n'))
+    with pytest.raises(ValueError):
+        next(feed)
+    feed.close()
+
+
+def test_game_feed_raises_parse_errors():
+    pgn = io.StringIO('[Event "First"]\n\n1. e4 e5 *\n\n[Event "Second"]\n\n1. e4 e5 2. Ke3 Nc6 *\n')
+    with GameFeed(pgn) as feed:
+        assert next(feed).headers["Event"] == "First", "Games before the error should be consumed."
+        with pytest.raises(chess.IllegalMoveError):
+            next(feed)
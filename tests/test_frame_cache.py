@@ -0,0 +1,43 @@
+import os
+import chess
+import numpy as np
+from manim_chessrender.frame_cache import FrameCache
+
+
+def test_frame_cache_keys():
+    transposed = chess.Board()
+    for move in ['g1f3', 'g8f6', 'b1c3', 'b8c6']:
+        transposed.push_uci(move)
+    board = chess.Board()
+    for move in ['b1c3', 'b8c6', 'g1f3', 'g8f6']:
+        board.push_uci(move)
+    assert FrameCache.key(board, "theme", (854, 480)) == FrameCache.key(transposed, "theme", (854, 480)), \
+        "Transpositions should share a frame."
+    assert FrameCache.key(board, "theme", (854, 480)) != FrameCache.key(board, "theme", (1920, 1080)), \
+        "Resolutions should not share a frame."
+
+
+def test_frame_cache_round_trip_and_eviction(tmp_path):
+    frame = np.arange(4000, dtype=np.uint8).reshape(10, 100, 4)
+    cache = FrameCache(str(tmp_path), max_bytes=2 * 4200)
+    cache.put("first", frame)
+    assert np.array_equal(cache.get("first"), frame), "Cached frames should be read back."
+    assert cache.get("missing") is None
+
+    cache.put("second", frame)
+    os.utime(cache.path("second"), ns=(1, 1))
+    cache.get("first")
+    cache.put("third", frame)
+    assert cache.get("second") is None, "The least recently used frame should be evicted."
+    assert cache.get("first") is not None and cache.get("third") is not None
+    assert cache.size <= cache.max_bytes
+
+
+def test_frame_cache_replaces_frames(tmp_path):
+    frame = np.zeros((10, 100, 4), dtype=np.uint8)
+    cache = FrameCache(str(tmp_path))
+    cache.put("frame", frame)
+    size = cache.size
+    cache.put("frame", frame)
+    assert cache.size == size == os.path.getsize(cache.path("frame")), \
+        "Storing a frame again should not count the replaced frame."
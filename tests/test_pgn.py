@@ -0,0 +1,81 @@
+import os
+import io
+import pytest
+import chess
+from manim_chessrender.pgn import iter_games, PGNIndex
+
+EXAMPLE_PGN = os.path.join(os.path.dirname(__file__), '..', 'example', 'example.pgn')
+
+
+def test_iter_games_reads_every_game():
+    games = list(iter_games(EXAMPLE_PGN))
+    assert len(games) > 1, "Example PGN should contain several games."
+    headers, moves = games[0]
+    assert headers["White"] == "Mackenzie, George Henry", "Headers not read correctly."
+    assert moves[0] == chess.Move.from_uci('e2e4'), "Moves not read correctly."
+
+
+def test_iter_games_filters_and_skips():
+    all_games = list(iter_games(EXAMPLE_PGN))
+    paulsen_white = [game for game in all_games if game[0]["White"] == "Paulsen, Louis"]
+    filtered = list(iter_games(EXAMPLE_PGN, where={"White": "Paulsen, Louis"}, skip=1, limit=2))
+    assert [moves for _, moves in filtered] == [moves for _, moves in paulsen_white[1:3]], \
+        "Filtering, skipping and limiting should select the matching games."
+
+
+def test_iter_games_skips_variations():
+    pgn = io.StringIO('[Event "?"]\n\n1. e4 (1. d4 d5) e5 2. Nf3 *\n')
+    (_, moves), = iter_games(pgn)
+    assert [move.uci() for move in moves] == ['e2e4', 'e7e5', 'g1f3'], "Only mainline moves should be read."
+
+
+def test_iter_games_strict():
+    pgn = '[Event "?"]\n\n1. e4 e5 2. Ke3 Nc6 *\n'
+    (_, moves), = iter_games(io.StringIO(pgn))
+    assert [move.uci() for move in moves] == ['e2e4', 'e7e5'], "Moves before a parse error should be read."
+    with pytest.raises(chess.IllegalMoveError):
+        list(iter_games(io.StringIO(pgn), strict=True))
+
+
+def test_header_filter_type():
+    with pytest.raises(TypeError):
+        list(iter_games(EXAMPLE_PGN, where="White"))
+
+
+def test_pgn_index_random_access(tmp_path):
+    index = PGNIndex(EXAMPLE_PGN, index_path=str(tmp_path / "example.idx"))
+    games = list(iter_games(EXAMPLE_PGN))
+    assert len(index) == len(games), "Index should find every game."
+    headers, moves = index.read_game(5)
+    assert moves == games[5][1], "Seeking to a game should read the same moves."
+    assert headers["White"] == games[5][0]["White"], "Seeking to a game should read the same headers."
+    assert index.find({"White": "Paulsen, Louis"}) == [
+        game_id for game_id, (headers, _) in enumerate(games) if headers["White"] == "Paulsen, Louis"]
+    where = {"Site": "London", "White": "Paulsen, Louis"}
+    assert index.find(where) == [game_id for game_id, (headers, _) in enumerate(games)
+                                 if headers["Site"] == "London" and headers["White"] == "Paulsen, Louis"], \
+        "Tags outside the index should be read from the game headers."
+    assert len(index.find({"Site": "London"})) == 54
+
+
+def test_pgn_index_revalidates(tmp_path):
+    pgn_path = tmp_path / "games.pgn"
+    pgn_path.write_text('[Event "First"]\n\n1. e4 e5 *\n\n')
+    assert len(PGNIndex(str(pgn_path))) == 1
+    assert os.path.exists(str(pgn_path) + ".idx"), "Index should be stored next to the PGN file."
+    with open(pgn_path, "a") as pgn_file:
+        pgn_file.write('[Event "Second"]\n\n1. d4 d5 *\n')
+    index = PGNIndex(str(pgn_path))
+    assert len(index) == 2, "A stale index should be rebuilt."
+    assert index.entries[1]["Event"] == "Second"
+    assert [move.uci() for move in index.read_game(1)[1]] == ['d2d4', 'd7d5']
+
+
+def test_pgn_index_finds_games_without_headers(tmp_path):
+    pgn_path = tmp_path / "games.pgn"
+    pgn_path.write_text('1. c4 c5 *\n\n[Event "Second"]\n\n1. e4 e5 *\n\n1. d4 d5 *\n')
+    index = PGNIndex(str(pgn_path))
+    games = list(iter_games(str(pgn_path)))
+    assert len(index) == len(games) == 3, "Games without headers should be indexed."
+    assert [index.read_game(game_id)[1] for game_id in range(len(index))] == [moves for _, moves in games]
+    assert index.entries[1]["Event"] == "Second", "Headers should stay with their game."
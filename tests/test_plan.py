@@ -0,0 +1,43 @@
+import pytest
+import chess
+from manim_chessrender.plan import compile_moves, batch_plan, SLIDE, FADE, SPAWN, BANNER
+
+
+def test_compile_simple_moves():
+    plan = compile_moves(['e2e4', 'd7d5', 'e4d5'])
+    assert plan[0].ops == ((SLIDE, chess.E2, chess.E4),), "Quiet moves should slide."
+    assert plan[2].ops == ((FADE, chess.D5), (SLIDE, chess.E4, chess.D5)), "Captures should fade the target."
+
+
+def test_compile_special_moves():
+    castling = compile_moves(['e1g1'], start_fen="4k3/8/8/8/8/8/8/4K2R w K - 0 1")[0]
+    assert castling.ops == ((SLIDE, chess.E1, chess.G1), (SLIDE, chess.H1, chess.F1)), \
+        "Castling should slide the king and the rook."
+    en_passant = compile_moves(['e5d6'], start_fen="4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1")[0]
+    assert en_passant.ops == ((FADE, chess.D5), (SLIDE, chess.E5, chess.D6)), \
+        "En passant should fade the passed pawn."
+    promotion = compile_moves(['a7a8n'], start_fen="4k3/P7/8/8/8/8/8/4K3 w - - 0 1")[0]
+    assert promotion.ops == ((SLIDE, chess.A7, chess.A8), (FADE, chess.A7), (SPAWN, chess.A8, 'N')), \
+        "Promotion should replace the pawn."
+
+
+def test_compile_terminal_banner():
+    plan = compile_moves(['f2f3', 'e7e5', 'g2g4', 'd8h4'])
+    assert plan[-1].ops[-1] == (BANNER, "Checkmate!"), "Checkmate should end with a banner."
+
+
+def test_compile_rejects_illegal_moves():
+    with pytest.raises(ValueError):
+        compile_moves(['e2e5'])
+    assert len(compile_moves(['e2e5'], validate=False)) == 1
+
+
+def test_batch_plan():
+    plan = compile_moves(['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5'])
+    assert [len(batch) for batch in batch_plan(plan, plies_per_batch=2)] == [2, 2, 1], \
+        "Batches should hold at most plies_per_batch plies."
+    assert [len(batch) for batch in batch_plan(plan, time_budget=3, ply_time=1.5)] == [2, 2, 1], \
+        "Batches should fit the time budget."
+    assert [len(batch) for batch in batch_plan(plan, time_budget=1)] == [1] * 5, \
+        "A batch should hold at least one ply."
+    assert batch_plan(plan) == [plan], "Without limits the plan should be one batch."
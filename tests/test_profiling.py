@@ -0,0 +1,31 @@
+import json
+from manim_chessrender import profiling
+from manim_chessrender.plan import compile_moves
+from manim_chessrender.profiling import Profiler
+
+
+def test_profiler_collects_counters_and_timers(tmp_path):
+    output = tmp_path / "profile.json"
+    with Profiler("test", output=str(output)):
+        compile_moves(['e2e4', 'e7e5'])
+        profiling.count("custom", 3)
+    assert profiling.active_profiler() is None, "The profiler should be deactivated on exit."
+    profile = json.loads(output.read_text())
+    assert profile["counters"] == {"custom": 3, "legality_checks": 2}, "Counters should be collected."
+    assert profile["timers"]["compile_moves"]["calls"] == 1, "Timed calls should be collected."
+
+
+def test_profiler_callback_and_nesting():
+    profiles = []
+    with Profiler("outer", output=profiles.append) as outer:
+        with Profiler("inner", output=profiles.append):
+            profiling.count("event")
+        assert profiling.active_profiler() is outer, "Nested profilers should restore the outer one."
+    assert [profile["name"] for profile in profiles] == ["inner", "outer"], "Profiles should go to the callback."
+    assert "event" not in outer.counters, "Only the active profiler should count."
+
+
+def test_profiling_off_records_nothing():
+    profiler = Profiler()
+    compile_moves(['e2e4'])
+    assert profiler.counters == {} and profiler.timers == {}, "Inactive profilers should record nothing."
@@ -0,0 +1,30 @@
+from itertools import accumulate
+import av
+import numpy as np
+from manim_chessrender.render import concat_movies, render_scene, render_segment, split_plies
+from manim_chessrender.scenes import GameScene
+
+MOVES = ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6']
+
+
+def read_frames(path):
+    with av.open(path) as movie:
+        rate = movie.streams.video[0].average_rate
+        return [frame.to_ndarray(format="rgb24").astype(int) for frame in movie.decode(video=0)], rate
+
+
+def test_split_render_matches_sequential_render(tmp_path):
+    whole, rate = read_frames(render_scene(lambda: GameScene(MOVES), str(tmp_path / "whole.mp4")))
+    parts = [render_segment(MOVES, start, end, str(tmp_path / f"plies-{start}-{end}.mp4"))
+             for start, end in split_plies(len(MOVES), 3)]
+    split, _ = read_frames(concat_movies(parts, str(tmp_path / "split.mp4")))
+    counts = [len(read_frames(part)[0]) for part in parts]
+
+    assert len(split) == len(whole), "The joined segments should last as long as the sequential render."
+    assert counts[0] - counts[1] == round(rate), "Only the first segment should hold the starting position."
+    assert counts[1] == counts[2], "Later segments should only play their moves."
+    for boundary in accumulate(counts[:-1]):
+        for index in (0, boundary - 1, boundary):
+            # Both movies are encoded separately, so allow for compression noise
+            assert np.abs(split[index] - whole[index]).mean() < 2, \
+                f"Frame {index} around the segment boundary at frame {boundary} should match."
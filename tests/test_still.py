@@ -0,0 +1,33 @@
+import pytest
+import chess
+from manim_chessrender.still import StillRenderer, parse_placement
+
+
+def test_parse_placement():
+    assert list(parse_placement("8/8/8/8/8/8/8/4K2k")) == [(chess.E1, 'K'), (chess.H1, 'k')], \
+        "Pieces should be read with their squares."
+    with pytest.raises(ValueError):
+        list(parse_placement("8/8/8/8/8/8/8/4X3"))
+
+
+def test_render_position(tmp_path):
+    renderer = StillRenderer(size=160, labels=False)
+    empty = renderer.render("8/8/8/8/8/8/8/8")
+    assert empty.size == (160, 160), "The image should be 8 squares wide."
+    assert empty.getpixel((10, 150)) == (92, 135, 72), "a1 should be a dark square blended at 0.7 opacity."
+    assert empty.getpixel((30, 150)) == (178, 178, 178), "b1 should be a light square blended at 0.7 opacity."
+
+    image = renderer.render(chess.STARTING_FEN)
+    assert image.getpixel((90, 150)) != empty.getpixel((90, 150)), "Pieces should be drawn on their squares."
+    assert image.getpixel((90, 90)) == empty.getpixel((90, 90)), "Empty squares should show the background."
+    path = renderer.save(chess.STARTING_FEN, str(tmp_path / "start.png"))
+    assert (tmp_path / "start.png").stat().st_size > 0, "The image should be written to " + path
+
+
+def test_render_flipped():
+    renderer = StillRenderer(size=160, labels=False)
+    flipped = StillRenderer(size=160, labels=False, flipped=True)
+    fen = "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+    assert flipped.square_origin(chess.E1) == (60, 0), "White should be at the top of a flipped board."
+    assert flipped.render(fen).crop((60, 0, 80, 20)) == renderer.render(fen).crop((80, 140, 100, 160)), \
+        "Squares should look the same on a flipped board."
@@ -1,7 +1,13 @@
 import pytest
-from manim import Mobject, WHITE, GREEN, BLACK
+import numpy as np
+from manim import Mobject, WHITE, GREEN, BLACK, Scene, Text, tempconfig
 from manim_chessrender.mobjects.chessboard import ChessBoard
-from manim_chessrender.mobjects.chess_piece import Queen, King, Pawn, Rook, Bishop, Knight
+from manim_chessrender.mobjects.board_grid import ChessBoardGrid
+from manim_chessrender.mobjects.chess_piece import Queen, King, Pawn, Rook, Bishop, Knight, clear_image_cache
+from manim_chessrender.plan import compile_moves
+from manim_chessrender.animations import PieceSlide
+from manim_chessrender.frame_cache import FrameCache
+from manim_chessrender.scenes import condensed_playback, hold, PGNFeedScene
 import chess
 
 
@@ -76,6 +82,8 @@ def test_handle_promotion(chess_board):
     promoted_index = chess_board.position_to_index('e8')
     assert isinstance(
         chess_board.elements[promoted_index], Queen), "Pawn not promoted to Queen correctly."
+    assert chess_board.elements[promoted_index] in chess_board.board.submobjects, \
+        "The promoted piece should join the board group."
 
 
 def test_load_fen(chess_board):
@@ -87,3 +95,232 @@ def test_load_fen(chess_board):
         chess_board.elements[63], Rook), "FEN loading failed for h8."
     assert isinstance(
         chess_board.elements[8], Pawn), "FEN loading failed for a2."
+
+
+def test_piece_images_are_shared():
+    first, second = Pawn(WHITE), Pawn(WHITE)
+    first_pixels = first.submobjects[0].pixel_array
+    second_pixels = second.submobjects[0].pixel_array
+    assert first_pixels is second_pixels, "Pieces of the same type should share one pixel buffer."
+    assert not first_pixels.flags.writeable, "Shared pixel buffer should be read-only."
+    first.submobjects[0].set_opacity(0.5)
+    assert second.submobjects[0].pixel_array is second_pixels, "Modifying one piece should not affect others."
+    image = second.submobjects[0]
+    assert image.invert_image is False and "white-pawn" in image.path, \
+        "Shared images should carry the attributes of an ImageMobject."
+
+
+def test_boards_are_stamped_from_template():
+    first, second = ChessBoard(), ChessBoard()
+    assert first.squares['a1'] is not second.squares['a1'], "Boards should not share Square objects."
+    assert np.allclose(first.squares['e4'].get_center(), second.squares['e4'].get_center()), \
+        "Template copies should keep square positions."
+    assert len(second.labels) == 16, "Template copies should keep all labels."
+
+
+def test_square_centers(chess_board):
+    assert chess_board.square_centers.shape == (8, 8, 3), "Square centers should be an (8, 8, 3) array."
+    assert (chess_board.square_center('e5') == [0.5, 0.5, 0]).all(), "Incorrect center for e5."
+    assert np.allclose(chess_board.squares['a1'].get_center(), chess_board.square_center('a1')), \
+        "Square a1 not positioned at its precomputed center."
+
+
+def test_flip(chess_board):
+    chess_board.initialize_board()
+    a1_center = chess_board.square_center('a1').copy()
+    chess_board.flip()
+    assert (chess_board.square_center('h8') == a1_center).all(), "h8 should take a1's place after flipping."
+    assert np.allclose(chess_board.elements[63].get_center(), a1_center), "Rook on h8 not moved when flipping."
+
+
+def test_atlas_labels_are_shared():
+    board = ChessBoard(label_mode="atlas")
+    other = ChessBoard(square_colors=(WHITE, BLACK), label_mode="atlas")
+    assert board.labels[0] is not other.labels[0], "Boards should not share label mobjects."
+    assert np.allclose(board.labels[0].family_members_with_points()[0].points,
+                       other.labels[0].family_members_with_points()[0].points), \
+        "Atlas glyphs should have the same outlines on every board."
+    with pytest.raises(ValueError):
+        ChessBoard(label_mode="bitmap")
+
+
+def test_add_elements(chess_board):
+    king, queen = King(WHITE), Queen(BLACK)
+    chess_board.add_elements([('e1', king), ('d8', queen)])
+    assert chess_board.elements[4] is king, "King not added correctly to the board."
+    assert chess_board.elements[59] is queen, "Queen not added correctly to the board."
+    assert king in chess_board.board.submobjects, "Added pieces should be part of the board group."
+    assert len(chess_board.submobjects) == 1, "Regrouping should not stack board groups."
+
+
+def test_deferred_grouping(chess_board):
+    king = King(WHITE)
+    with chess_board.deferred_grouping():
+        chess_board.add_element('e1', king)
+        assert king not in chess_board.board.submobjects, "Regrouping should wait for the block to exit."
+    assert king in chess_board.board.submobjects, "Pieces should be grouped when the block exits."
+
+
+def test_incremental_load_fen(chess_board):
+    chess_board.initialize_board()
+    king = chess_board.elements[4]
+    e_pawn = chess_board.elements[12]
+    chess_board.load_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1", incremental=True)
+    assert chess_board.elements[4] is king, "Pieces on unchanged squares should be kept."
+    assert chess_board.elements[28] is e_pawn, "Moved pieces should be reused."
+    assert not isinstance(chess_board.elements[12], Pawn), "Vacated square should be empty."
+    assert chess_board.chessboard.turn == chess.BLACK, "FEN state should be loaded into the chess board."
+
+
+def test_incremental_load_fen_animation(chess_board):
+    chess_board.load_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    animation = chess_board.load_fen("4k3/8/8/8/8/8/8/3QK3 w - - 0 1", incremental=True, animate=True)
+    assert animation is not None, "Animated transition should return an animation."
+    assert isinstance(chess_board.elements[3], Queen), "New pieces should be created."
+
+
+def test_apply_ply(chess_board):
+    chess_board.initialize_board()
+    plan = compile_moves(['e2e4', 'd7d5', 'e4d5'])
+    pawn = chess_board.elements[chess.E2]
+    captured = chess_board.elements[chess.D7]
+    for ply in plan:
+        assert chess_board.apply_ply(ply) is not None, "Applying a ply should return an animation."
+    assert chess_board.elements[chess.D5] is pawn, "Pawn not moved correctly by the plan."
+    assert not isinstance(chess_board.elements[chess.E2], Pawn), "Vacated square should be empty."
+    assert chess_board.chessboard.board_fen() == "rnbqkbnr/ppp1pppp/8/3P4/8/8/PPPP1PPP/RNBQKBNR", \
+        "Chess board state should follow the plan."
+    assert pawn in chess_board.board.submobjects, "Moved pieces should stay in the board group."
+    assert captured not in chess_board.board.submobjects, "Captured pieces should leave the board group."
+
+
+def test_piece_codes_follow_chessboard(chess_board):
+    chess_board.initialize_board()
+    for move in ['e2e4', 'd7d5', 'e4d5', 'd8d5']:
+        chess_board.execute_move(move)
+    expected = bytearray(64)
+    for square, piece in chess_board.chessboard.piece_map().items():
+        expected[square] = ord(piece.symbol())
+    assert chess_board.piece_codes == expected, "Piece codes should match the chess board."
+    assert chess_board.elements[chess.E2] is None, "Empty squares should hold no mobject."
+    assert len(chess_board.board.submobjects) == 64 + 16 + 30, "Empty squares should add nothing to the board group."
+
+
+def test_piece_slide(chess_board):
+    chess_board.initialize_board()
+    king, rook = chess_board.elements[chess.E1], chess_board.elements[chess.H1]
+    pixels = king.submobjects[0].pixel_array
+    slide = PieceSlide((king, chess_board.square_center('g1')), (rook, chess_board.square_center('f1')))
+    slide.begin()
+    slide.interpolate(0.5)
+    assert np.allclose(king.get_center(), (chess_board.square_center('e1') + chess_board.square_center('g1')) / 2), \
+        "Pieces should be halfway at alpha 0.5."
+    slide.finish()
+    assert np.allclose(rook.get_center(), chess_board.square_center('f1')), "Pieces should end on their targets."
+    assert king.submobjects[0].pixel_array is pixels, "Sliding should not copy the piece image."
+    assert PieceSlide((king, chess_board.square_center('e1')), group=chess_board.board).mobject is chess_board.board, \
+        "The given group should be animated in place of a new group."
+
+
+def test_played_moves_keep_board_group(chess_board, tmp_path):
+    chess_board.load_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+    with tempconfig({"media_dir": str(tmp_path)}):
+        scene = Scene(skip_animations=True)
+        scene.add(chess_board.board)
+        for move in ['e5d6', 'e8c8', 'e1g1', 'd8d6']:
+            scene.play(chess_board.execute_move(move))
+            assert scene.mobjects == [chess_board.board], f"Playing {move} should leave the board group intact."
+    assert len(chess_board.board.submobjects) == 64 + 16 + 6, "Captured pieces should be gone from the board."
+
+
+def test_seek(chess_board):
+    moves = ['e2e4', 'd7d5', 'e4d5', 'd8d5', 'b1c3']
+    chess_board.load_game(moves)
+    assert [ply.move.uci() for ply in chess_board.game_plan] == moves, "Loading a game should compile its moves."
+    chess_board.seek(4)
+    assert chess_board.ply == 4, "Seeking should play the moves before the ply."
+    assert isinstance(chess_board.elements[chess.D5], Queen), "Pieces should follow the seeked position."
+    assert chess_board.elements[chess.D8] is None, "Vacated squares should be empty."
+    chess_board.seek(1)
+    assert chess_board.chessboard.board_fen() == "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR", \
+        "Seeking backward should undo moves."
+    assert isinstance(chess_board.elements[chess.D7], Pawn), "Pieces should be restored when seeking backward."
+    with pytest.raises(ValueError):
+        chess_board.seek(6)
+
+
+def test_condensed_playback(chess_board):
+    chess_board.initialize_board()
+    plan = compile_moves(['e2e4', 'd7d5', 'e4d5'])
+    animations = list(condensed_playback(chess_board, plan, plies_per_play=2, move_time=1, ply_wait=0.5))
+    assert len(animations) == 2, "Plies should be played in batches."
+    assert animations[0].run_time == pytest.approx(3), "A batch should last as long as its plies and waits."
+    assert chess_board.chessboard.board_fen() == "rnbqkbnr/ppp1pppp/8/3P4/8/8/PPPP1PPP/RNBQKBNR", \
+        "Every ply should be applied."
+
+
+def test_piece_rasters_match_resolution(tmp_path, monkeypatch):
+    monkeypatch.setenv("MANIM_CHESSRENDER_CACHE", str(tmp_path))
+    clear_image_cache()
+    with tempconfig({"quality": "low_quality"}):
+        low = King(WHITE)
+    with tempconfig({"quality": "fourk_quality"}):
+        high = King(WHITE)
+    clear_image_cache()
+    assert low.submobjects[0].pixel_array.shape[0] < high.submobjects[0].pixel_array.shape[0], \
+        "Low quality renders should use smaller rasters."
+    assert np.isclose(low.height, high.height), "Pieces should have the same size at every resolution."
+    assert list((tmp_path / "pieces").glob("*.png")), "Scaled rasters should be cached on disk."
+
+
+def test_move_board(chess_board):
+    chess_board.initialize_board()
+    chess_board.move_board(np.array([2.0, 1.0, 0.0]), 0.5)
+    assert np.allclose(chess_board.square_center('a1'), [2 - 1.75, 1 - 1.75, 0]), "Square centers should follow the board."
+    assert np.allclose(chess_board.elements[chess.A1].get_center(), chess_board.square_center('a1')), \
+        "Pieces should follow the board."
+
+
+def test_board_grid():
+    grid = ChessBoardGrid(3, columns=2)
+    grid.load_games([['e2e4', 'e7e5'], ['d2d4']])
+    first, second, third = grid.boards
+    assert first.board.submobjects[0].points is not second.board.submobjects[0].points, \
+        "Boards should own their squares."
+    assert first.elements[chess.E2].submobjects[0].pixel_array is second.elements[chess.E2].submobjects[0].pixel_array, \
+        "Boards should share piece images."
+    assert len(list(grid.steps())) == 2, "The grid should step until the longest game ends."
+    assert first.chessboard.board_fen() == "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR", "Every ply should be applied."
+    assert third.ply == 0 and not any(third.elements), "Boards without a game should stay empty."
+
+
+def test_pgn_feed_scene_fades_only_the_banner(tmp_path):
+    pgn = tmp_path / "games.pgn"
+    pgn.write_text('[FEN "7k/5ppp/8/8/8/8/8/R3K3 w Q - 0 1"]\n\n1. O-O-O Kg8 2. Rd8# 1-0\n\n'
+                   '[Event "Second"]\n\n1. e4 e5 *\n')
+    with tempconfig({"media_dir": str(tmp_path)}):
+        scene = PGNFeedScene(str(pgn), intro_wait=0, ply_wait=0.1, skip_animations=True)
+        scene.setup()
+        scene.construct()
+    assert len(scene.mobjects) == 1, "The banner should be faded out and the board group left intact."
+    labels = [mobject for mobject in scene.mobjects[0].submobjects if isinstance(mobject, Text)]
+    assert len(labels) == 16, "The board labels should survive the move to the next game."
+
+
+def test_hold_reuses_cached_frame(chess_board, tmp_path, monkeypatch):
+    chess_board.initialize_board()
+    cache = FrameCache(str(tmp_path / "frames"))
+    options = {"media_dir": str(tmp_path), "quality": "low_quality", "disable_caching": True, "progress_bar": "none"}
+    with tempconfig(options):
+        scene = Scene()
+        scene.add(chess_board.board)
+        hold(scene, chess_board, 0.2, cache)
+        frame = scene.renderer.get_frame().copy()
+        assert cache.size > 0, "The first hold should store its frame."
+
+        def capture_mobjects(*args, **kwargs):
+            raise AssertionError("A cached hold should not rasterize any mobject.")
+
+        monkeypatch.setattr(scene.renderer.camera, "capture_mobjects", capture_mobjects)
+        hold(scene, chess_board, 0.2, cache)
+        assert np.array_equal(scene.renderer.get_frame(), frame), "The cached frame should be written again."